@@ -1,5 +1,5 @@
 import math
-from game_config import GAME_CONFIG
+from game_config import CFG
 
 class AIPlayer:
     """AI-controlled player that uses simple heuristics to challenge Player 1"""
@@ -9,7 +9,7 @@ class AIPlayer:
         self.player1 = player1
         self.walls = walls
         self.last_shot_time = 0
-        self.shot_cooldown = 1.0 / GAME_CONFIG['fire_rate']  # Minimum time between shots
+        self.shot_cooldown = 1.0 / CFG.fire_rate  # Minimum time between shots
         
     def update(self, dt, current_time):
         """Update AI behavior based on game state"""
@@ -21,7 +21,7 @@ class AIPlayer:
         # Movement logic
         if not self.player2.shield_active:
             # Move towards center line while maintaining distance from player1
-            target_x = GAME_CONFIG['tiles_width'] / 2
+            target_x = CFG.tiles_width / 2
             target_y = self.player1.y  # Mirror player1's vertical position
             
             # Calculate movement direction
@@ -41,13 +41,13 @@ class AIPlayer:
                 move_y = 1
                 
             # Apply movement
-            self.player2.move(move_x * GAME_CONFIG['player_speed'], 
-                            move_y * GAME_CONFIG['player_speed'], 
+            self.player2.move(move_x * CFG.player_speed, 
+                            move_y * CFG.player_speed, 
                             dt, current_time, self.player1, self.walls)
         
         # Shooting logic
         if (not self.player2.shield_active and 
-            distance < GAME_CONFIG['tiles_width'] / 2 and 
+            distance < CFG.tiles_width / 2 and 
             current_time - self.last_shot_time > self.shot_cooldown):
             self.player2.shoot(current_time)
             self.last_shot_time = current_time
@@ -55,7 +55,7 @@ class AIPlayer:
         # Shield logic
         # Activate shield if player1 is shooting and we're close
         if (len(self.player1.projectiles) > 0 and 
-            distance < GAME_CONFIG['tiles_width'] / 3):
+            distance < CFG.tiles_width / 3):
             self.player2.shield_active = True
         else:
             self.player2.shield_active = False 
\ No newline at end of file
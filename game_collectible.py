@@ -18,6 +18,10 @@ class GameCollectible:
     and add their own special abilities.
     """
     
+    # Fixed attribute set - instances don't need a __dict__
+    # (child classes declare __slots__ = () unless they add attributes)
+    __slots__ = ('x', 'y', 'color', 'size', 'rect')
+    
     def __init__(self, x, y, color):
         """
         Initialize a game collectible
@@ -76,6 +80,21 @@ class GameCollectible:
         pass
 
 
+def compound_end_time(end_time, current_time, duration):
+    """
+    Get the new end time of an effect that compounds when collected again
+    
+    Args:
+        end_time: When the effect currently ends (in the past if it isn't active)
+        current_time: Current game time
+        duration: How long one collection lasts (in seconds)
+        
+    Returns:
+        end_time + duration if the effect is still running, otherwise current_time + duration
+    """
+    return max(end_time, current_time) + duration
+
+
 # Collectible Registry - Maps collectible type strings to their classes
 # To add a new collectible type, just add an entry here and create the corresponding file!
 _COLLECTIBLE_REGISTRY = {}
@@ -209,6 +228,31 @@ def generate_collectible(collectible_type, walls, existing_collectibles=None, pl
     if existing_collectibles is None:
         existing_collectibles = []
     
+    # Get the collectible class from the registry
+    collectible_class = get_collectible_class(collectible_type)
+    if collectible_class is None:
+        # Collectible type not found in registry
+        print(f"Warning: Collectible type '{collectible_type}' not registered!")
+        return None
+    
+    return _place_collectible(collectible_class, walls, existing_collectibles, player1_pos, player2_pos, target_side)
+
+
+def _place_collectible(collectible_class, walls, existing_collectibles, player1_pos, player2_pos, target_side):
+    """
+    Create a collectible of the given class at a random valid position
+    
+    Args:
+        collectible_class: The GameCollectible subclass to create
+        walls: List of existing walls to avoid placing collectibles on
+        existing_collectibles: List of already placed collectibles to avoid overlapping
+        player1_pos: (x, y) tuple of player 1 position
+        player2_pos: (x, y) tuple of player 2 position
+        target_side: 'left' or 'right' to specify which side of the map
+        
+    Returns:
+        collectible_class instance or None if no valid position found
+    """
     # Get all valid positions for the target side
     valid_positions = _find_valid_positions(walls, existing_collectibles, player1_pos, player2_pos, target_side)
     
@@ -219,15 +263,8 @@ def generate_collectible(collectible_type, walls, existing_collectibles=None, pl
     # Pick a random position from valid positions
     x, y = random.choice(valid_positions)
     
-    # Get the collectible class from the registry
-    collectible_class = get_collectible_class(collectible_type)
-    if collectible_class:
-        # Create an instance of the collectible at the valid position
-        return collectible_class(x, y)
-    
-    # Collectible type not found in registry
-    print(f"Warning: Collectible type '{collectible_type}' not registered!")
-    return None
+    # Create an instance of the collectible at the valid position
+    return collectible_class(x, y)
 
 
 def generate_collectibles(walls, num_collectibles, player1_pos=None, player2_pos=None):
@@ -251,6 +288,21 @@ def generate_collectibles(walls, num_collectibles, player1_pos=None, player2_pos
     # Split the map in half horizontally (left side for Player 1, right side for Player 2)
     map_center_x = GAME_CONFIG['tiles_width'] / 2
     
+    # Look up the collectible classes once instead of once per spawn
+    speed_boost_class = get_collectible_class('speed_boost')
+    speed_buff_class = get_collectible_class('speed_buff')
+    
+    # If a type isn't registered, warn and use its class directly so the match still gets collectibles
+    # (imported here since the collectible modules import this one)
+    if speed_boost_class is None:
+        print("Warning: Collectible type 'speed_boost' not registered!")
+        from speed_boost_collectible import SpeedBoostCollectible
+        speed_boost_class = SpeedBoostCollectible
+    if speed_buff_class is None:
+        print("Warning: Collectible type 'speed_buff' not registered!")
+        from speed_buff_collectible import SpeedBuffCollectible
+        speed_buff_class = SpeedBuffCollectible
+    
     # Calculate collectibles per side - ensure exact equality
     collectibles_per_side = num_collectibles // 2
     extra_collectible = num_collectibles % 2  # If odd number, we'll randomly assign the extra one
@@ -265,10 +317,8 @@ def generate_collectibles(walls, num_collectibles, player1_pos=None, player2_pos
             attempts += 1
             
             # Generate random collectible type
-            if random.random() < 0.5:
-                collectible = generate_collectible('speed_boost', walls, collectibles, player1_pos, player2_pos, 'left')
-            else:
-                collectible = generate_collectible('speed_buff', walls, collectibles, player1_pos, player2_pos, 'left')
+            collectible_class = speed_boost_class if random.random() < 0.5 else speed_buff_class
+            collectible = _place_collectible(collectible_class, walls, collectibles, player1_pos, player2_pos, 'left')
             
             # Must be on the LEFT side (x < center)
             if collectible and collectible.x < map_center_x:
@@ -324,12 +374,10 @@ def generate_collectibles(walls, num_collectibles, player1_pos=None, player2_pos
                         break
                 
                 if not overlaps_collectible:
-                    from speed_boost_collectible import SpeedBoostCollectible
-                    from speed_buff_collectible import SpeedBuffCollectible
                     if random.random() < 0.5:
-                        collectible = SpeedBoostCollectible(x, y)
+                        collectible = speed_boost_class(x, y)
                     else:
-                        collectible = SpeedBuffCollectible(x, y)
+                        collectible = speed_buff_class(x, y)
                     collectibles.append(collectible)
     
     # Generate collectibles for RIGHT side (Player 2 area)
@@ -346,10 +394,8 @@ def generate_collectibles(walls, num_collectibles, player1_pos=None, player2_pos
             attempts += 1
             
             # Generate random collectible type
-            if random.random() < 0.5:
-                collectible = generate_collectible('speed_boost', walls, collectibles, player1_pos, player2_pos, 'right')
-            else:
-                collectible = generate_collectible('speed_buff', walls, collectibles, player1_pos, player2_pos, 'right')
+            collectible_class = speed_boost_class if random.random() < 0.5 else speed_buff_class
+            collectible = _place_collectible(collectible_class, walls, collectibles, player1_pos, player2_pos, 'right')
             
             # Must be on the RIGHT side (x >= center)
             if collectible and collectible.x >= map_center_x:
@@ -404,12 +450,10 @@ def generate_collectibles(walls, num_collectibles, player1_pos=None, player2_pos
                         break
                 
                 if not overlaps_collectible:
-                    from speed_boost_collectible import SpeedBoostCollectible
-                    from speed_buff_collectible import SpeedBuffCollectible
                     if random.random() < 0.5:
-                        collectible = SpeedBoostCollectible(x, y)
+                        collectible = speed_boost_class(x, y)
                     else:
-                        collectible = SpeedBuffCollectible(x, y)
+                        collectible = speed_buff_class(x, y)
                     collectibles.append(collectible)
     
     return collectibles
@@ -1,4 +1,6 @@
 # Game configuration - all game settings are stored here for easy modification
+from types import SimpleNamespace
+
 GAME_CONFIG = {
     'tile_size_in_pixels': 20,      # Size of one tile in pixels
     'tiles_width': 40,    # Width of the game board in tiles
@@ -65,6 +67,10 @@ GAME_CONFIG['window_width_in_pixels'] = GAME_CONFIG['tiles_width'] * GAME_CONFIG
 GAME_CONFIG['window_height_in_pixels'] = (GAME_CONFIG['tiles_height'] * GAME_CONFIG['tile_size_in_pixels'] + 
                                         GAME_CONFIG['stats_panel_height_in_pixels'])
 
+# The same settings as attributes (CFG.fps instead of GAME_CONFIG['fps']) - attribute
+# access is cheaper than a dict lookup, so per-frame code reads the settings from here
+CFG = SimpleNamespace(**GAME_CONFIG)
+
 # Colors used in the game - defined as RGB tuples
 COLORS = {
     'background': (255, 255, 255),  # White
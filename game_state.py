@@ -1,5 +1,5 @@
 import time
-from game_config import GAME_CONFIG
+from game_config import CFG
 
 
 class GameState:
@@ -17,15 +17,15 @@ class GameState:
         self.match_over = False
         self.round_over = False
         self.countdown_active = True
-        self.countdown_ticks = GAME_CONFIG['countdown_ticks']
-        self.last_countdown_update = time.time()
+        self.countdown_ticks = CFG.countdown_ticks
+        self.last_countdown_update = time.perf_counter()
     
     def reset_round(self):
         """Reset for a new round"""
         self.round_over = False
         self.countdown_active = True
-        self.countdown_ticks = GAME_CONFIG['countdown_ticks']
-        self.last_countdown_update = time.time()
+        self.countdown_ticks = CFG.countdown_ticks
+        self.last_countdown_update = time.perf_counter()
     
     def update_countdown(self, current_time):
         """
@@ -39,7 +39,7 @@ class GameState:
         """
         if self.countdown_active:
             # 4 steps total (3,2,1,GO), so divide total duration by 4
-            if current_time - self.last_countdown_update >= GAME_CONFIG['countdown_duration'] / 4:
+            if current_time - self.last_countdown_update >= CFG.countdown_duration / 4:
                 self.countdown_ticks -= 1
                 self.last_countdown_update = current_time
                 if self.countdown_ticks < 0:
@@ -59,7 +59,7 @@ class GameState:
         self.round_over = True
         
         # Check for match victory
-        if self.round_wins[winner_num - 1] >= GAME_CONFIG['rounds_to_win']:
+        if self.round_wins[winner_num - 1] >= CFG.rounds_to_win:
             self.match_over = True
         
         # Increment round number AFTER displaying the victory screen
@@ -1,14 +1,14 @@
 import pygame
 import sys
-import time  # For tracking effect durations
+import time  # For tracking effect durations (perf_counter never jumps like the wall clock can)
 import random  # For random wall placement
 import math  # For calculating distances
 from game_config import GAME_CONFIG, COLORS
 from ai_player import AIPlayer
 from player import Player
 from game_state import GameState
-from renderer import Renderer
-from wall import Wall
+from renderer import Renderer, STATS_PANEL_RECT
+from wall import Wall, draw_walls, walls_any_overlap
 from game_collectible import generate_collectibles
 import collectibles  # Import all collectible types to register them
 
@@ -22,6 +22,47 @@ pygame.joystick.init()
 screen = pygame.display.set_mode((GAME_CONFIG['window_width_in_pixels'], GAME_CONFIG['window_height_in_pixels']))
 pygame.display.set_caption("Learning Python Game - Sprint 3")
 
+# The background and center line never change, so draw them once onto their own
+# surface and copy that onto the screen at the start of each frame
+background = pygame.Surface(screen.get_size()).convert()
+background.fill(COLORS['background'])
+center_x = GAME_CONFIG['tiles_width'] / 2
+pygame.draw.line(background, COLORS['center_line'],
+                (center_x * GAME_CONFIG['tile_size_in_pixels'], 0),
+                (center_x * GAME_CONFIG['tile_size_in_pixels'],
+                 GAME_CONFIG['tiles_height'] * GAME_CONFIG['tile_size_in_pixels']))
+
+# Events after which the whole window has to be shown again (it was uncovered or
+# restored), since during play only the areas that changed are normally updated
+_REDRAW_EVENTS = (pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED, pygame.VIDEOEXPOSE)
+
+# Only these event types are handled by the game loop. Blocking everything else
+# lets SDL drop mouse motion, other window and axis events before they ever become
+# Python objects
+HANDLED_EVENTS = [pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP,
+                  pygame.JOYBUTTONDOWN, pygame.JOYBUTTONUP, *_REDRAW_EVENTS]
+pygame.event.set_blocked(None)
+pygame.event.set_allowed(HANDLED_EVENTS)
+
+# Movement keys, bound to plain ints once so the per-frame key lookups skip the
+# pygame attribute lookups
+_K_W, _K_A, _K_S, _K_D = pygame.K_w, pygame.K_a, pygame.K_s, pygame.K_d  # Player 1
+_K_UP, _K_LEFT, _K_DOWN, _K_RIGHT = pygame.K_UP, pygame.K_LEFT, pygame.K_DOWN, pygame.K_RIGHT  # Player 2
+
+# Shoot and shield keys, mapped to the index of their player in (player1, player2)
+_SHOOT_KEYS = {pygame.K_v: 0, pygame.K_COMMA: 1}
+_SHIELD_KEYS = {pygame.K_b: 0, pygame.K_PERIOD: 1}
+
+# Config values read every frame
+_FPS = GAME_CONFIG['fps']
+_SPEED = GAME_CONFIG['player_speed']
+_USE_CONTROLLERS = GAME_CONFIG['use_controllers']
+_AI_ENABLED = GAME_CONFIG['ai_enabled']
+
+# While nothing is moving (instructions, countdown, victory screens) the screen
+# is redrawn at most this often, in seconds. Input is still read every frame
+_IDLE_FRAME_TIME = 1.0 / 30
+
 # Create a clock object to control game speed
 clock = pygame.time.Clock()
 
@@ -134,11 +175,7 @@ def generate_walls():
                     break
             
             # Check if overlaps with existing walls
-            overlaps = False
-            for existing_wall in walls:
-                if temp_wall.overlaps_with(existing_wall):
-                    overlaps = True
-                    break
+            overlaps = walls_any_overlap(temp_wall, walls)
             
             # Check if overlaps with player starting positions
             if not overlaps and not too_close:
@@ -209,13 +246,26 @@ player1_pos = (player1.start_x, player1.start_y)
 player2_pos = (player2.start_x, player2.start_y)
 game_collectibles = generate_collectibles(walls, GAME_CONFIG['num_collectibles_per_match'], player1_pos, player2_pos)
 
+# Time one frame may take (in seconds) and whether the last frame took longer
+frame_budget = 1.0 / _FPS
+frame_overran = False
+
+# When the screen was last drawn, and whether that frame was an idle screen
+last_render_time = 0
+was_idle = False
+
+# Areas of the screen that could have changed in the last gameplay frame that was
+# shown (None when the last frame shown was not a gameplay frame)
+last_dirty_rects = None
+
 while running:
     # Calculate delta time in seconds
-    dt = clock.tick(GAME_CONFIG['fps']) / 1000.0  # Convert milliseconds to seconds
-    current_time = time.time()
+    dt = clock.tick(_FPS) / 1000.0  # Convert milliseconds to seconds
+    frame_start = time.perf_counter()
+    current_time = frame_start
     
     # Handle events (keyboard input, window close, etc.)
-    for event in pygame.event.get():
+    for event in pygame.event.get(HANDLED_EVENTS):
         if event.type == pygame.QUIT:
             running = False
         elif event.type == pygame.KEYDOWN:
@@ -244,25 +294,21 @@ while running:
                     player1, player2, ai_controller = reset_players(player1, player2, walls)
             else:
                 # Handle shooting
-                if not game_state.countdown_active:
-                    if event.key == pygame.K_v:  # Player 1 shoot
-                        player1.shoot(current_time)
-                    elif event.key == pygame.K_COMMA:  # Player 2 shoot
-                        player2.shoot(current_time)
+                player_index = _SHOOT_KEYS.get(event.key)
+                if player_index is not None and not game_state.countdown_active:
+                    (player1, player2)[player_index].shoot(current_time)
                 # Handle shield activation
-                if event.key == pygame.K_b:  # Player 1 shield
-                    player1.shield_active = True
-                elif event.key == pygame.K_PERIOD:  # Player 2 shield
-                    player2.shield_active = True
+                player_index = _SHIELD_KEYS.get(event.key)
+                if player_index is not None:
+                    (player1, player2)[player_index].shield_active = True
         elif event.type == pygame.KEYUP:
             # Handle shield deactivation
-            if event.key == pygame.K_b:  # Player 1 shield
-                player1.shield_active = False
-            elif event.key == pygame.K_PERIOD:  # Player 2 shield
-                player2.shield_active = False
+            player_index = _SHIELD_KEYS.get(event.key)
+            if player_index is not None:
+                (player1, player2)[player_index].shield_active = False
         elif event.type == pygame.JOYBUTTONDOWN:
             # Handle controller button presses
-            if GAME_CONFIG['use_controllers']:
+            if _USE_CONTROLLERS:
                 # Controller 1 (Player 1) buttons
                 if event.joy == 0 and controller1:
                     if event.button == 0:  # A button - shoot
@@ -279,7 +325,7 @@ while running:
                         player2.shield_active = True
         elif event.type == pygame.JOYBUTTONUP:
             # Handle controller button releases
-            if GAME_CONFIG['use_controllers']:
+            if _USE_CONTROLLERS:
                 # Controller 1 (Player 1) buttons
                 if event.joy == 0 and controller1:
                     if event.button == 1:  # B button - shield release
@@ -288,6 +334,9 @@ while running:
                 elif event.joy == 1 and controller2:
                     if event.button == 1:  # B button - shield release
                         player2.shield_active = False
+        elif event.type in _REDRAW_EVENTS:
+            # Make the next frame flip the whole screen
+            last_dirty_rects = None
     
     # Update countdown if active
     if game_state.countdown_active:
@@ -300,30 +349,30 @@ while running:
         keys = pygame.key.get_pressed()
         
         # Calculate movement for Player 1
-        if GAME_CONFIG['use_controllers'] and controller1:
+        if _USE_CONTROLLERS and controller1:
             # Use controller 1 left stick
-            dx1 = controller1.get_axis(0) * GAME_CONFIG['player_speed']  # Left stick X
-            dy1 = controller1.get_axis(1) * GAME_CONFIG['player_speed']  # Left stick Y
+            dx1 = controller1.get_axis(0) * _SPEED  # Left stick X
+            dy1 = controller1.get_axis(1) * _SPEED  # Left stick Y
         else:
             # Use keyboard (WASD)
-            dx1 = (keys[pygame.K_d] - keys[pygame.K_a]) * GAME_CONFIG['player_speed']
-            dy1 = (keys[pygame.K_s] - keys[pygame.K_w]) * GAME_CONFIG['player_speed']
+            dx1 = (keys[_K_D] - keys[_K_A]) * _SPEED
+            dy1 = (keys[_K_S] - keys[_K_W]) * _SPEED
         
         # Move Player 1
         player1.move(dx1, dy1, dt, current_time, player2, walls)
         
         # Handle Player 2 movement
-        if GAME_CONFIG['ai_enabled'] and ai_controller:
+        if _AI_ENABLED and ai_controller:
             ai_controller.update(dt, current_time)
-        elif GAME_CONFIG['use_controllers'] and controller2:
+        elif _USE_CONTROLLERS and controller2:
             # Use controller 2 left stick
-            dx2 = controller2.get_axis(0) * GAME_CONFIG['player_speed']  # Left stick X
-            dy2 = controller2.get_axis(1) * GAME_CONFIG['player_speed']  # Left stick Y
+            dx2 = controller2.get_axis(0) * _SPEED  # Left stick X
+            dy2 = controller2.get_axis(1) * _SPEED  # Left stick Y
             player2.move(dx2, dy2, dt, current_time, player1, walls)
         else:
             # Use keyboard (Arrow keys)
-            dx2 = (keys[pygame.K_RIGHT] - keys[pygame.K_LEFT]) * GAME_CONFIG['player_speed']
-            dy2 = (keys[pygame.K_DOWN] - keys[pygame.K_UP]) * GAME_CONFIG['player_speed']
+            dx2 = (keys[_K_RIGHT] - keys[_K_LEFT]) * _SPEED
+            dy2 = (keys[_K_DOWN] - keys[_K_UP]) * _SPEED
             player2.move(dx2, dy2, dt, current_time, player1, walls)
         
         # Check win condition
@@ -351,62 +400,78 @@ while running:
                 collectible.apply_effect(player2, current_time, player1)
                 game_collectibles.remove(collectible)
     
-    # Clear the screen with background color
-    screen.fill(COLORS['background'])
+    # Nothing moves on the instructions, countdown and victory screens, so skip
+    # drawing and flipping until the idle frame time has passed (the screen
+    # keeps showing the last frame that was drawn). The first idle frame after
+    # play is always drawn, so overlays appear as soon as they start
+    idle = show_instructions or game_over or game_state.countdown_active
+    if idle and was_idle and current_time - last_render_time < _IDLE_FRAME_TIME:
+        continue
+    last_render_time = current_time
+    was_idle = idle
     
-    # Draw instructions screen if showing
+    # Draw instructions screen if showing (it covers the whole window)
     if show_instructions:
         renderer.draw_instructions_screen()
     else:
-        # Draw center line
-        center_x = GAME_CONFIG['tiles_width'] / 2
-        pygame.draw.line(screen, COLORS['center_line'], 
-                        (center_x * GAME_CONFIG['tile_size_in_pixels'], 0),
-                        (center_x * GAME_CONFIG['tile_size_in_pixels'], 
-                         GAME_CONFIG['tiles_height'] * GAME_CONFIG['tile_size_in_pixels']))
+        # Clear the screen to the background and center line
+        screen.blit(background, (0, 0))
         
         # Draw walls
-        for wall in walls:
-            wall.draw(screen)
+        draw_walls(screen, walls)
         
         # Draw collectibles
         for collectible in game_collectibles:
             collectible.draw(screen)
-            # Draw players with shield effect if active
-        for player in [player1, player2]:
+        
+        # Draw players with shield effect if active
+        for player in (player1, player2):
             if player.shield_active:
-                # Draw shield effect (slightly larger rectangle)
-                shield_rect = pygame.Rect(
-                    player.rect.x - 2,
-                    player.rect.y - 2,
-                    player.rect.width + 4,
-                    player.rect.height + 4
-                )
-                pygame.draw.rect(screen, player.color, shield_rect, 2)  # 2 is line width
-            pygame.draw.rect(screen, player.color, player.rect)
+                # Draw shield effect (rectangle 2 pixels bigger on every side)
+                pygame.draw.rect(screen, player.color, player.rect.inflate(4, 4), 2)  # 2 is line width
+            screen.fill(player.color, player.rect)
         
         # Draw projectiles
-        for projectile in player1.projectiles:
-            projectile.draw(screen)
-        for projectile in player2.projectiles:
-            projectile.draw(screen)
+        player1.draw_projectiles(screen)
+        player2.draw_projectiles(screen)
         
-        # Draw stats panel
-        renderer.draw_stats_panel(player1, player2)
+        # Draw stats panel (if the last frame ran over its time budget, reuse
+        # the last drawn stats so this frame has a chance to catch up)
+        renderer.draw_stats_panel(player1, player2, current_time, refresh=not frame_overran)
         
         # Draw appropriate victory screen
         if game_over:
             if game_state.match_over:
                 renderer.draw_match_victory_screen(winner, player1, player2, game_state)
             else:
-                renderer.draw_round_victory_screen(winner, player1, player2, game_state)
+                renderer.draw_round_victory_screen(winner, player1, player2, game_state, current_time)
         
         # Draw countdown if active
         if game_state.countdown_active:
             renderer.draw_countdown(game_state)
     
+    # Remember whether this frame's work took longer than a frame should
+    frame_overran = time.perf_counter() - frame_start > frame_budget
+    
     # Update the display
-    pygame.display.flip()
+    if idle:
+        # Overlays cover the board, so show the whole screen
+        pygame.display.flip()
+        last_dirty_rects = None
+    else:
+        # During play only the players, projectiles, collectibles and stats panel
+        # can change. Each is marked where it is now and, through last frame's
+        # list, where it was before, so only those areas are copied to the display
+        # (projectile rects are copied since they move in place and get reused)
+        dirty_rects = [player1.rect.inflate(4, 4), player2.rect.inflate(4, 4), STATS_PANEL_RECT]
+        dirty_rects.extend(projectile.rect.copy() for projectile in player1.projectiles)
+        dirty_rects.extend(projectile.rect.copy() for projectile in player2.projectiles)
+        dirty_rects.extend(collectible.rect for collectible in game_collectibles)
+        if last_dirty_rects is None:
+            pygame.display.flip()  # Coming from an overlay, so everything changed
+        else:
+            pygame.display.update(last_dirty_rects + dirty_rects)
+        last_dirty_rects = dirty_rects
 
 # Clean up and exit
 pygame.quit()
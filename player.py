@@ -1,7 +1,76 @@
 import pygame
 import time
-from game_config import GAME_CONFIG, COLORS
-from projectile import Projectile
+from collections import deque
+from game_config import CFG, COLORS
+from projectile import Projectile, get_projectile_surface
+
+# Speed effect settings used on every speed calculation, looked up once
+_SLOW_FACTOR = CFG.slow_factor  # e.g., 0.5
+_INV_SLOW_DURATION = 1.0 / CFG.slow_duration
+_SPEEDUP_FACTOR = CFG.speedup_factor  # e.g., 1.5
+_INV_SPEEDUP_DURATION = 1.0 / CFG.speedup_duration
+_SHIELD_BOOST_MAX = CFG.shield_boost_max
+
+# Board size in tiles
+_TILES_WIDTH = CFG.tiles_width
+_TILES_HEIGHT = CFG.tiles_height
+
+# Furthest a player's top-left corner can go (players are one tile big)
+_X_MAX = _TILES_WIDTH - 1
+_Y_MAX = _TILES_HEIGHT - 1
+
+# Square of the closest the players can get on both axes (one tile plus a 0.1 tile buffer)
+_MIN_GAP_SQUARED = 1.1 * 1.1
+
+# Progress towards the center line (percent per tile covered)
+_CENTER_X = _TILES_WIDTH / 2
+_PROGRESS_SCALE = 100.0 / _CENTER_X
+
+
+def compute_speed_multiplier(current_time, slow_end_time, speedup_end_time, shield_boost_sum):
+    """
+    Calculate a speed multiplier from effect timers and active shield boosts
+    
+    Plain float math with no object access, kept separate from Player so it
+    can be timed or compiled on its own
+    
+    Args:
+        current_time: Current game time
+        slow_end_time: When the slow effect ends
+        speedup_end_time: When the speedup effect ends
+        shield_boost_sum: Total of the active shield boosts
+        
+    Returns:
+        Speed multiplier (1.0 = normal, 0.5 = half speed, 1.5 = 50% faster)
+    """
+    # Base speed is always 100%
+    base_speed = 1.0
+    
+    # Calculate shield boost (temporary, from blocking)
+    shield_boost = min(shield_boost_sum, _SHIELD_BOOST_MAX)
+    
+    # Calculate temporary effect (slow or speedup)
+    if current_time < slow_end_time:
+        # Calculate regeneration from slow
+        time_remaining = slow_end_time - current_time
+        # Linearly regenerate from slow factor to 1.0
+        temp_effect = _SLOW_FACTOR + (1.0 - _SLOW_FACTOR) * (1.0 - time_remaining * _INV_SLOW_DURATION)
+    elif current_time < speedup_end_time:
+        # Calculate decay from speedup
+        time_remaining = speedup_end_time - current_time
+        # Linearly decay from speedup factor to 1.0
+        temp_effect = 1.0 + (_SPEEDUP_FACTOR - 1.0) * (time_remaining * _INV_SPEEDUP_DURATION)
+    else:
+        temp_effect = 1.0  # No temporary effect
+    
+    # Combine effects, ensuring we never exceed 100% from regeneration
+    total_speed = base_speed + shield_boost
+    if temp_effect < 1.0:  # If we're slowed
+        total_speed *= temp_effect  # Apply slow multiplicatively
+    else:  # If we're sped up
+        total_speed = min(total_speed + (temp_effect - 1.0), 1.5)  # Add speedup, cap at 150%
+    
+    return total_speed
 
 
 class Player:
@@ -33,17 +102,23 @@ class Player:
         # Shooting
         self.last_shot_time = 0  # Time of last shot
         self.projectiles = []  # List of active projectiles
+        self.projectile_pool = []  # Spent projectiles kept for reuse by the next shots
         
         # Shield
         self.shield_active = False  # Whether shield is currently active
-        self.shield_boosts = []  # List of (end_time, boost_amount) tuples
+        self.shield_boosts = deque()  # (end_time, boost_amount) tuples, oldest (soonest to end) first
+        self.shield_boost_sum = 0.0  # Total of the boost amounts in shield_boosts
+        
+        # Last speed multiplier and the (time, effect timers, boost total) it was computed for
+        self._speed_cache_key = None
+        self._speed_cache_value = 1.0
         
         # Create rect for drawing, converting float positions to integers
         self.rect = pygame.Rect(
-            int(self.x * GAME_CONFIG['tile_size_in_pixels']),
-            int(self.y * GAME_CONFIG['tile_size_in_pixels']),
-            GAME_CONFIG['tile_size_in_pixels'],
-            GAME_CONFIG['tile_size_in_pixels']
+            int(self.x * CFG.tile_size_in_pixels),
+            int(self.y * CFG.tile_size_in_pixels),
+            CFG.tile_size_in_pixels,
+            CFG.tile_size_in_pixels
         )
     
     def reset(self):
@@ -57,17 +132,20 @@ class Player:
         self.speedup_end_time = 0
         self.block_speedups = 0
         
-        # Reset shooting
+        # Reset shooting (active projectiles go back to the pool)
         self.last_shot_time = 0
+        self.projectile_pool.extend(self.projectiles)
         self.projectiles = []
         
         # Reset shield
         self.shield_active = False
-        self.shield_boosts = []
+        self.shield_boosts.clear()
+        self.shield_boost_sum = 0.0
+        self._speed_cache_key = None
         
         # Update rect for drawing
-        self.rect.x = int(self.x * GAME_CONFIG['tile_size_in_pixels'])
-        self.rect.y = int(self.y * GAME_CONFIG['tile_size_in_pixels'])
+        self.rect.x = int(self.x * CFG.tile_size_in_pixels)
+        self.rect.y = int(self.y * CFG.tile_size_in_pixels)
     
     def is_slowed(self, current_time):
         """Check if player is currently slowed"""
@@ -87,41 +165,27 @@ class Player:
         Returns:
             Speed multiplier (1.0 = normal, 0.5 = half speed, 1.5 = 50% faster)
         """
-        # Base speed is always 100%
-        base_speed = 1.0
+        # Remove expired shield boosts
+        # They all last the same time, so they expire in the order they were added
+        shield_boosts = self.shield_boosts
+        if shield_boosts and shield_boosts[0][0] <= current_time:
+            while shield_boosts and shield_boosts[0][0] <= current_time:
+                shield_boosts.popleft()
+            self.shield_boost_sum = sum(boost for _, boost in shield_boosts)
         
-        # Calculate shield boost (temporary, from blocking)
-        shield_boost = 0.0
-        # Remove expired boosts and sum active ones
-        self.shield_boosts = [(end_time, boost) for end_time, boost in self.shield_boosts 
-                            if current_time < end_time]
-        shield_boost = sum(boost for _, boost in self.shield_boosts)
-        shield_boost = min(shield_boost, GAME_CONFIG['shield_boost_max'])
+        # The multiplier is asked for several times per frame (movement, shooting,
+        # stats panel), so reuse the last result while nothing it depends on changed
+        slow_end_time = self.slow_end_time
+        speedup_end_time = self.speedup_end_time
+        cache_key = (current_time, slow_end_time, speedup_end_time, self.shield_boost_sum)
+        if cache_key == self._speed_cache_key:
+            return self._speed_cache_value
         
-        # Calculate temporary effect (slow or speedup)
-        temp_effect = 0.0
-        if self.is_slowed(current_time):
-            # Calculate regeneration from slow
-            time_remaining = self.slow_end_time - current_time
-            slow_factor = GAME_CONFIG['slow_factor']  # e.g., 0.5
-            # Linearly regenerate from slow_factor to 1.0
-            temp_effect = slow_factor + (1.0 - slow_factor) * (1.0 - time_remaining / GAME_CONFIG['slow_duration'])
-        elif self.is_speedup(current_time):
-            # Calculate decay from speedup
-            time_remaining = self.speedup_end_time - current_time
-            speedup_factor = GAME_CONFIG['speedup_factor']  # e.g., 1.5
-            # Linearly decay from speedup_factor to 1.0
-            temp_effect = 1.0 + (speedup_factor - 1.0) * (time_remaining / GAME_CONFIG['speedup_duration'])
-        else:
-            temp_effect = 1.0  # No temporary effect
-        
-        # Combine effects, ensuring we never exceed 100% from regeneration
-        total_speed = base_speed + shield_boost
-        if temp_effect < 1.0:  # If we're slowed
-            total_speed *= temp_effect  # Apply slow multiplicatively
-        else:  # If we're sped up
-            total_speed = min(total_speed + (temp_effect - 1.0), 1.5)  # Add speedup, cap at 150%
+        total_speed = compute_speed_multiplier(current_time, slow_end_time, speedup_end_time,
+                                               self.shield_boost_sum)
         
+        self._speed_cache_key = cache_key
+        self._speed_cache_value = total_speed
         return total_speed
     
     def get_fire_rate_multiplier(self, current_time):
@@ -141,7 +205,7 @@ class Player:
         if self.shield_active:
             return False
         fire_rate_multiplier = self.get_fire_rate_multiplier(current_time)
-        return current_time - self.last_shot_time >= 1.0 / (GAME_CONFIG['fire_rate'] * fire_rate_multiplier)
+        return current_time - self.last_shot_time >= 1.0 / (CFG.fire_rate * fire_rate_multiplier)
     
     def apply_effect(self, effect_type, duration, current_time):
         """
@@ -161,8 +225,28 @@ class Player:
                 self.speedup_end_time = current_time + duration
         elif effect_type == 'block':
             # Add a new shield boost
-            self.shield_boosts.append((current_time + GAME_CONFIG['shield_boost_duration'], 
-                                     GAME_CONFIG['shield_boost_amount']))
+            # Every boost lasts the same time, so shield_boosts stays sorted by end time
+            # and the last boost is always the longest-lasting one
+            end_time = current_time + CFG.shield_boost_duration
+            self.shield_boosts.append((end_time, CFG.shield_boost_amount))
+            self.shield_boost_sum = sum(boost for _, boost in self.shield_boosts)
+    
+    def spawn_projectile(self, x, y, direction, is_deflected=False):
+        """
+        Add a projectile to this player's active projectiles, reusing a spent one if possible
+        
+        Args:
+            x: Starting x position (in tiles)
+            y: Starting y position (in tiles)
+            direction: Direction of travel (1 = right, -1 = left)
+            is_deflected: Whether this is a deflected shot (travels 2x speed)
+        """
+        if self.projectile_pool:
+            projectile = self.projectile_pool.pop()
+            projectile.reset(x, y, direction, is_deflected)
+        else:
+            projectile = Projectile(x, y, direction, is_deflected)
+        self.projectiles.append(projectile)
     
     def shoot(self, current_time):
         """
@@ -178,7 +262,7 @@ class Player:
             
             # Create and add projectile
             direction = 1 if self.color == COLORS['player1'] else -1
-            self.projectiles.append(Projectile(projectile_x, projectile_y, direction))
+            self.spawn_projectile(projectile_x, projectile_y, direction)
             self.last_shot_time = current_time
     
     def move(self, dx, dy, dt, current_time, other_player, walls=None):
@@ -205,36 +289,38 @@ class Player:
             new_y = self.y + dy * dt * speed_multiplier
             
             # Check if new position is within screen bounds (in tiles)
-            if (0 <= new_x <= GAME_CONFIG['tiles_width'] - 1 and
-                0 <= new_y <= GAME_CONFIG['tiles_height'] - 1):
+            if 0 <= new_x <= _X_MAX and 0 <= new_y <= _Y_MAX:
                 
                 # Check for collision with other player
                 # We use a small buffer (0.1 tiles) to prevent players from getting too close
-                if (abs(new_x - other_player.x) >= 1.1 or 
-                    abs(new_y - other_player.y) >= 1.1):
+                # (squared distances compare the same as absolute ones, without calling abs)
+                gap_x = new_x - other_player.x
+                gap_y = new_y - other_player.y
+                if gap_x * gap_x >= _MIN_GAP_SQUARED or gap_y * gap_y >= _MIN_GAP_SQUARED:
                     
                     # Check for collision with walls
                     can_move = True
                     if walls:
                         # Create temporary rect for collision detection
                         temp_rect = pygame.Rect(
-                            int(new_x * GAME_CONFIG['tile_size_in_pixels']),
-                            int(new_y * GAME_CONFIG['tile_size_in_pixels']),
-                            GAME_CONFIG['tile_size_in_pixels'],
-                            GAME_CONFIG['tile_size_in_pixels']
+                            int(new_x * CFG.tile_size_in_pixels),
+                            int(new_y * CFG.tile_size_in_pixels),
+                            CFG.tile_size_in_pixels,
+                            CFG.tile_size_in_pixels
                         )
                         
-                        for wall in walls:
-                            if temp_rect.colliderect(wall.rect):
-                                can_move = False
-                                break
+                        # collidelist scans all the walls in one call (-1 = no wall hit)
+                        # The rects are taken from walls on each call, so walls added or
+                        # removed during a match are picked up straight away
+                        if temp_rect.collidelist([wall.rect for wall in walls]) != -1:
+                            can_move = False
                     
                     if can_move:
                         self.x = new_x
                         self.y = new_y
                         # Update rect for drawing, converting float positions to integers
-                        self.rect.x = int(self.x * GAME_CONFIG['tile_size_in_pixels'])
-                        self.rect.y = int(self.y * GAME_CONFIG['tile_size_in_pixels'])
+                        self.rect.x = int(self.x * CFG.tile_size_in_pixels)
+                        self.rect.y = int(self.y * CFG.tile_size_in_pixels)
     
     def update_projectiles(self, dt, other_player, current_time, walls=None):
         """
@@ -249,81 +335,94 @@ class Player:
         # Constants for sub-stepping collision detection
         MAX_STEP_SIZE = 0.5  # Maximum tiles to move per sub-step (half player size)
         
-        # Update existing projectiles
-        for projectile in self.projectiles[:]:
-            # Get movement path with sub-steps
-            start_positions = projectile.get_movement_with_substeps(dt, max_step_size=MAX_STEP_SIZE)
+        # Wall rects for collidelist, which scans them all in one call
+        wall_rects = [wall.rect for wall in walls] if walls else None
+        
+        # Values that stay the same for every step of every projectile, looked up once
+        tile_size = CFG.tile_size_in_pixels
+        other_rect = other_player.rect
+        
+        # Update existing projectiles, keeping the ones that didn't hit anything
+        # (collected into a new list in one pass instead of removing hits one by one)
+        survivors = []
+        for projectile in self.projectiles:
+            # Split the movement into sub-steps
+            num_steps, step_size = projectile.get_substeps(dt, max_step_size=MAX_STEP_SIZE)
+            start_x = projectile.x
+            step = projectile.direction * step_size
+            rect = projectile.rect
+            # Projectiles only move horizontally, so the vertical bounds check is the same at every step
+            y_in_bounds = 0 <= projectile.y <= _TILES_HEIGHT
             
             collision_detected = False
             
-            # Check each position along the path for collision
-            for i, (check_x, check_y) in enumerate(start_positions[1:], start=1):  # Skip start position
-                # Temporarily move projectile to this position for collision testing
-                projectile.x = check_x
-                projectile.rect.x = int(projectile.x * GAME_CONFIG['tile_size_in_pixels'])
+            # Check each position along the path for collision (skipping the start position)
+            # The position is kept in a local while stepping and stored once at the end
+            for i in range(1, num_steps + 1):
+                # Move projectile to this position for collision testing
+                x = start_x + step * i
+                rect.x = int(x * tile_size)
                 
                 # Check if projectile is out of bounds
-                if (projectile.x < 0 or 
-                    projectile.x > GAME_CONFIG['tiles_width'] or
-                    projectile.y < 0 or 
-                    projectile.y > GAME_CONFIG['tiles_height']):
+                if not (y_in_bounds and 0 <= x <= _TILES_WIDTH):
                     collision_detected = True
                     break
                 
-                # Check for collision with walls
-                hit_wall = False
-                if walls:
-                    for wall in walls:
-                        if projectile.rect.colliderect(wall.rect):
-                            collision_detected = True
-                            hit_wall = True
-                            break
-                    
-                    if hit_wall:
-                        break
+                # Check for collision with walls (-1 = no wall hit)
+                if wall_rects and rect.collidelist(wall_rects) != -1:
+                    collision_detected = True
+                    break
                 
                 # Check for collision with other player
-                if projectile.rect.colliderect(other_player.rect):
+                if rect.colliderect(other_rect):
                     collision_detected = True
                     
                     # If other player's shield is active, block the projectile and fire back at 2x speed
                     if other_player.shield_active:
                         # Give the blocking player a speed boost
-                        other_player.apply_effect('block', GAME_CONFIG['shield_boost_duration'], current_time)
+                        other_player.apply_effect('block', CFG.shield_boost_duration, current_time)
                         
                         # Create a deflected projectile that goes back at the attacker
                         # Direction is reversed (if projectile was going right, deflect left, and vice versa)
                         deflect_direction = -projectile.direction
                         
                         # Spawn deflected projectile at the blocking player's position
-                        from projectile import Projectile
-                        deflected_shot = Projectile(
+                        # It belongs to the blocking player's projectiles
+                        # This ensures it won't be deflected by the original shooter's shield
+                        other_player.spawn_projectile(
                             x=other_player.x + (1 if deflect_direction == 1 else -1),
                             y=other_player.y,
                             direction=deflect_direction,
                             is_deflected=True  # This makes it travel at 2x speed
                         )
-                        
-                        # Add the deflected shot to the blocking player's projectiles
-                        # This ensures it won't be deflected by the original shooter's shield
-                        other_player.projectiles.append(deflected_shot)
                     else:
                         # Apply effects when hit without shield
-                        other_player.apply_effect('slow', GAME_CONFIG['slow_duration'], current_time)
-                        self.apply_effect('speedup', GAME_CONFIG['speedup_duration'], current_time)
+                        other_player.apply_effect('slow', CFG.slow_duration, current_time)
+                        self.apply_effect('speedup', CFG.speedup_duration, current_time)
                     
                     break
                 
                 # No collision at this step, move to next position
                 collision_detected = False
             
-            # Remove projectile if collision detected or update to final position
+            # Drop projectile if collision detected (otherwise it is already at its final position)
             if collision_detected:
-                self.projectiles.remove(projectile)
+                self.projectile_pool.append(projectile)  # Keep it for a later shot
             else:
-                # Move projectile to final position (last position in the path)
-                projectile.x = start_positions[-1][0]
-                projectile.rect.x = int(projectile.x * GAME_CONFIG['tile_size_in_pixels'])
+                projectile.x = x
+                survivors.append(projectile)
+        
+        self.projectiles = survivors
+    
+    def draw_projectiles(self, screen):
+        """
+        Draw all of this player's projectiles in a single blits call
+        
+        Args:
+            screen: The pygame surface to draw on
+        """
+        surface = get_projectile_surface(screen)
+        screen.blits([(surface, projectile.rect) for projectile in self.projectiles], doreturn=0)
     
     def get_progress(self):
         """
@@ -333,14 +432,9 @@ class Player:
         Returns:
             Progress percentage (0-100)
         """
-        center_x = GAME_CONFIG['tiles_width'] / 2
-        if self.x < center_x:  # Player 1
-            # Calculate distance to center, considering player's size
-            distance_to_center = center_x - (self.x + 1)  # +1 because we want first pixel to reach
-            total_distance = center_x
-            return ((total_distance - distance_to_center) / total_distance) * 100
+        # Progress is the distance covered out of the distance from the edge to the center line
+        x = self.x
+        if x < _CENTER_X:  # Player 1
+            return (x + 1) * _PROGRESS_SCALE  # +1 because we want first pixel to reach
         else:  # Player 2
-            # Calculate distance to center, considering player's size
-            distance_to_center = (self.x) - center_x  # No +1 because we want first pixel to reach
-            total_distance = center_x
-            return ((total_distance - distance_to_center) / total_distance) * 100
+            return (_TILES_WIDTH - x) * _PROGRESS_SCALE  # No +1 because we want first pixel to reach
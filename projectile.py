@@ -1,6 +1,28 @@
 import pygame
 import math
-from game_config import GAME_CONFIG
+from game_config import CFG
+
+# Every projectile looks the same, so they are all drawn by blitting one filled square
+# (made on first use, since it is converted to the display's pixel format)
+_projectile_surface = None
+
+
+def get_projectile_surface(screen):
+    """
+    Get the filled square every projectile is drawn with
+    
+    Args:
+        screen: The pygame surface projectiles are drawn on
+        
+    Returns:
+        Surface in the same pixel format as screen, so blitting it needs no conversion
+    """
+    global _projectile_surface
+    if _projectile_surface is None:
+        size = CFG.projectile_size * CFG.tile_size_in_pixels
+        _projectile_surface = pygame.Surface((size, size)).convert(screen)
+        _projectile_surface.fill(CFG.projectile_color)
+    return _projectile_surface
 
 
 class Projectile:
@@ -10,6 +32,26 @@ class Projectile:
         """
         Initialize a projectile
         
+        Args:
+            x: Starting x position (in tiles)
+            y: Starting y position (in tiles)
+            direction: Direction of travel (1 for P1 going right, -1 for P2 going left)
+            is_deflected: Whether this is a deflected shot (travels 2x speed)
+        """
+        # Create rect for drawing (positioned by reset)
+        self.rect = pygame.Rect(
+            0,
+            0,
+            CFG.projectile_size * CFG.tile_size_in_pixels,
+            CFG.projectile_size * CFG.tile_size_in_pixels
+        )
+        self.reset(x, y, direction, is_deflected)
+    
+    def reset(self, x, y, direction, is_deflected=False):
+        """
+        Place the projectile at a new starting point, so a spent projectile
+        can be reused for a new shot instead of creating another one
+        
         Args:
             x: Starting x position (in tiles)
             y: Starting y position (in tiles)
@@ -21,13 +63,9 @@ class Projectile:
         self.direction = direction  # 1 for P1, -1 for P2
         self.is_deflected = is_deflected
         
-        # Create rect for drawing, converting float positions to integers
-        self.rect = pygame.Rect(
-            int(self.x * GAME_CONFIG['tile_size_in_pixels']),
-            int(self.y * GAME_CONFIG['tile_size_in_pixels']),
-            GAME_CONFIG['projectile_size'] * GAME_CONFIG['tile_size_in_pixels'],
-            GAME_CONFIG['projectile_size'] * GAME_CONFIG['tile_size_in_pixels']
-        )
+        # Update rect for drawing, converting float positions to integers
+        self.rect.x = int(self.x * CFG.tile_size_in_pixels)
+        self.rect.y = int(self.y * CFG.tile_size_in_pixels)
     
     def get_speed_multiplier(self):
         """Get the speed multiplier for this projectile"""
@@ -41,44 +79,28 @@ class Projectile:
             dt: Time delta (in seconds) since last frame
         """
         speed_multiplier = self.get_speed_multiplier()
-        self.x += self.direction * GAME_CONFIG['projectile_speed'] * speed_multiplier * dt
-        self.rect.x = int(self.x * GAME_CONFIG['tile_size_in_pixels'])
+        self.x += self.direction * CFG.projectile_speed * speed_multiplier * dt
+        self.rect.x = int(self.x * CFG.tile_size_in_pixels)
     
-    def get_movement_with_substeps(self, dt, max_step_size=0.5):
+    def get_substeps(self, dt, max_step_size=0.5):
         """
-        Calculate the movement path with sub-steps for collision detection
+        Split this frame's movement into equal sub-steps for collision detection
         
         Args:
             dt: Time delta (in seconds) since last frame
             max_step_size: Maximum distance to move per sub-step (in tiles)
             
         Returns:
-            list: List of intermediate positions (x, y) including start and end
+            (num_steps, step_size) - after step i (1 to num_steps) the projectile
+            is at its starting x + direction * step_size * i
         """
         speed_multiplier = self.get_speed_multiplier()
-        distance = abs(self.direction * GAME_CONFIG['projectile_speed'] * speed_multiplier * dt)
+        distance = abs(self.direction * CFG.projectile_speed * speed_multiplier * dt)
         
         # If moving slow enough, no sub-stepping needed
         if distance <= max_step_size:
-            return [(self.x, self.y), (self.x + self.direction * distance, self.y)]
+            return 1, distance
         
         # Calculate number of sub-steps needed
         num_steps = math.ceil(distance / max_step_size)
-        step_size = distance / num_steps
-        
-        positions = []
-        for i in range(num_steps + 1):
-            step_distance = step_size * i
-            x_pos = self.x + self.direction * step_distance
-            positions.append((x_pos, self.y))
-        
-        return positions
-    
-    def draw(self, screen):
-        """
-        Draw the projectile on the screen
-        
-        Args:
-            screen: The pygame surface to draw on
-        """
-        pygame.draw.rect(screen, GAME_CONFIG['projectile_color'], self.rect)
+        return num_steps, distance / num_steps
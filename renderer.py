@@ -1,42 +1,130 @@
 import pygame
-import time
-from game_config import GAME_CONFIG, COLORS
+from collections import OrderedDict
+from game_config import CFG, COLORS
 
-# Helper function to render multi-line text
-def render_multiline_text(font, text, color, max_width):
+# Maximum number of rendered text surfaces kept by the Renderer
+TEXT_CACHE_MAX_SIZE = 512
+
+# Opacity of the white wash over the background on the instructions screen
+INSTRUCTIONS_OVERLAY_ALPHA = 240
+
+# Stats panel layout in pixels - it only depends on GAME_CONFIG, so it is computed once
+STATS_PANEL_Y = CFG.tiles_height * CFG.tile_size_in_pixels
+STATS_PANEL_HEIGHT = CFG.stats_panel_height_in_pixels
+STATS_PANEL_WIDTH = CFG.window_width_in_pixels
+STATS_SECTION_WIDTH = STATS_PANEL_WIDTH // 2  # Each player gets half the width
+STATS_SECTION_PADDING = max(10, STATS_PANEL_WIDTH // 80)  # Responsive padding, minimum 10px
+STATS_LINE_SPACING = min(20, STATS_PANEL_HEIGHT // 5) + 3  # Responsive text height plus a gap
+STATS_BAR_HEIGHT = min(15, STATS_PANEL_HEIGHT // 6)  # Responsive bar height
+STATS_BAR_WIDTH = min(STATS_SECTION_WIDTH - 2 * STATS_SECTION_PADDING, 200)  # Cap bar width
+STATS_PROGRESS_OFFSET_X = STATS_SECTION_PADDING + STATS_BAR_WIDTH + STATS_SECTION_PADDING  # Text right of the bar
+# Y of a section's first line from the top of the panel, indexed by its number of text lines
+# (the block is centered vertically)
+STATS_START_Y = tuple((STATS_PANEL_HEIGHT - (num_lines * STATS_LINE_SPACING + STATS_BAR_HEIGHT + 5)) // 2
+                      for num_lines in range(6))
+# With many effects active the first lines start above the panel and run onto the board
+STATS_OVERFLOW = max(0, -min(STATS_START_Y))
+# Every pixel the stats panel can draw to, including that overflow
+STATS_PANEL_RECT = pygame.Rect(0, STATS_PANEL_Y - STATS_OVERFLOW,
+                               STATS_PANEL_WIDTH, STATS_PANEL_HEIGHT + STATS_OVERFLOW)
+
+
+# Instructions screen content as (text, style) pairs
+# Built once at import - every value it uses from GAME_CONFIG is fixed
+INSTRUCTIONS = (
+    ("How to Play", "title"),
+    ("1. Race to the finish line first!", "heading"),
+    ("Reach 100% at center to win the round.", "body"),
+    ("2. Use walls for cover", "heading"),
+    ("Hide behind gray walls. They block bullets.", "body"),
+    ("3. Combat controls", "heading"),
+    ("Player 1 (Red):", "p1"),
+    ("WASD = Move, V = Shoot, B = Shield", "body"),
+    ("Player 2 (Blue):", "p2"),
+    ("Arrows = Move, , = Shoot, . = Shield", "body"),
+    ("4. Getting hit slows you", "heading"),
+    (f"Speed drops to {CFG.slow_factor}x ({int((1-CFG.slow_factor)*100)}% slower) for {CFG.slow_duration:.0f}s. Attacker speeds up!", "body"),
+    ("5. Blocking gives speed boost", "heading"),
+    (f"Each block: +{int(CFG.shield_boost_amount*100)}% for {CFG.shield_boost_duration:.0f}s (max {int(CFG.shield_boost_max*100)}%).", "body"),
+    (f"6. Win {CFG.rounds_to_win} rounds to win match", "heading"),
+    (f"Best of {CFG.rounds_to_win * 2 - 1} rounds.", "body"),
+    ("", "spacer"),
+    ("Press SPACE to start", "prompt"),
+)
+
+
+# Helper function to split text into lines that fit a width
+def wrap_text(font, text, max_width):
     """
-    Render text with automatic line wrapping
+    Split text into lines that fit within a maximum width
+    
+    Only measures the text, nothing is rendered.
     
     Args:
         font: pygame font object
-        text: string to render
-        color: text color
+        text: string to wrap
         max_width: maximum width before wrapping
         
     Returns:
-        list of surface objects, one per line
+        list of strings, one per line
     """
+    # Most text fits on one line - skip the word-by-word layout
+    if font.size(text)[0] <= max_width:
+        return [text]
+    
     words = text.split(' ')
     lines = []
     current_line = []
+    current_width = 0
+    
+    # Add up word widths so the whole line doesn't have to be
+    # re-measured for every word
+    space_width = font.size(' ')[0]
     
     for word in words:
-        test_line = ' '.join(current_line + [word])
-        test_surface = font.render(test_line, True, color)
+        word_width = font.size(word)[0]
+        if current_line:
+            test_width = current_width + space_width + word_width
+        else:
+            test_width = word_width
         
-        if test_surface.get_width() <= max_width:
+        if test_width <= max_width:
             current_line.append(word)
+            current_width = test_width
         else:
             if current_line:
-                lines.append(font.render(' '.join(current_line), True, color))
+                lines.append(' '.join(current_line))
             current_line = [word]
+            current_width = word_width
     
     if current_line:
-        lines.append(font.render(' '.join(current_line), True, color))
+        lines.append(' '.join(current_line))
     
     return lines
 
 
+# Helper function to render multi-line text
+def render_multiline_text(font, text, color, max_width, render=None):
+    """
+    Render text with automatic line wrapping
+    
+    Args:
+        font: pygame font object
+        text: string to render
+        color: text color
+        max_width: maximum width before wrapping
+        render: optional function(font, text, color) used to render each line
+                (defaults to font.render with antialiasing)
+        
+    Returns:
+        list of surface objects, one per line
+    """
+    if render is None:
+        render = lambda line_font, line, line_color: line_font.render(line, True, line_color)
+    
+    return [render(font, line, color) for line in wrap_text(font, text, max_width)]
+
+
 class Renderer:
     """Handles all rendering and drawing operations for the game"""
     
@@ -50,346 +138,590 @@ class Renderer:
         """
         self.screen = screen
         self.font = font
+        
+        # Cache of rendered text surfaces keyed by (font, text, color), least recently used first
+        self._text_cache = OrderedDict()
+        
+        # Cache of default fonts keyed by point size
+        self._font_cache = {}
+        
+        # Pre-rendered instructions screen and the screen size it was made for
+        self._instructions_cache = None
+        self._instructions_cache_key = None
+        
+        # Instructions layout heights keyed by (font size, window width)
+        self._calc_height_cache = {}
+        
+        # Last values and surface of each stats panel line, keyed by (player_num, stat)
+        self._last_stats = {}
+        
+        # Last rendered full-screen overlays keyed by screen name, as (state, surface)
+        self._screen_cache = {}
+        
+        # Static part of the stats panel (background and separator line)
+        self._stats_background = self._render_stats_background()
+        
+        # Each player's last drawn stats panel section keyed by player_num, as (state, surface)
+        self._stats_sections = {}
+        
+        # Countdown fonts, loaded up front since the countdown is drawn every frame
+        # at the start of each round (their sizes only depend on the window height)
+        window_height = CFG.window_height_in_pixels
+        self._round_font = self._get_font(window_height // 8)  # Larger font for round number
+        self._match_point_font = self._get_font(window_height // 15)
+        self._countdown_font = self._get_font(window_height // 4)  # Much larger font for countdown
+        
+        # Black box the countdown number is drawn in (centered, a third of the width, a quarter of the height)
+        window_width = CFG.window_width_in_pixels
+        self._countdown_bg_rect = pygame.Rect((window_width - window_width // 3) // 2,
+                                              (window_height - window_height // 4) // 2,
+                                              window_width // 3, window_height // 4)
+        
+        # The countdown only ever shows a handful of strings, so each one is rendered
+        # and centered once here. Keyed by countdown_ticks (0 shows "GO!")
+        center = (window_width // 2, window_height // 2)
+        self._countdown_digits = {}
+        for ticks in range(CFG.countdown_ticks + 1):
+            text = str(ticks) if ticks > 0 else "GO!"
+            surface = self._countdown_font.render(text, True, (255, 255, 255))  # White text
+            self._countdown_digits[ticks] = (surface, surface.get_rect(center=center))
+        
+        # Labels above the countdown and the (round, match point) they were laid out for
+        self._countdown_labels = None
+        self._countdown_labels_key = None
     
-    def draw_stats_panel(self, player1, player2):
-        """Draw the stats panel below the game board"""
-        # Calculate stats panel position and dimensions
-        panel_y = GAME_CONFIG['tiles_height'] * GAME_CONFIG['tile_size_in_pixels']
-        panel_height = GAME_CONFIG['stats_panel_height_in_pixels']
-        panel_width = GAME_CONFIG['window_width_in_pixels']
-        
-        # Calculate section dimensions (each player gets half the width)
-        section_width = panel_width // 2
-        section_padding = max(10, panel_width // 80)  # Responsive padding, minimum 10px
-        
-        # Calculate element dimensions
-        text_height = min(20, panel_height // 5)  # Responsive text height
-        bar_height = min(15, panel_height // 6)   # Responsive bar height
-        bar_width = min(section_width - 2 * section_padding, 200)  # Cap bar width
-        
-        # Draw stats panel background
-        pygame.draw.rect(self.screen, COLORS['stats_panel'], 
-                        (0, panel_y, panel_width, panel_height))
-        
-        # Draw vertical separator line
-        pygame.draw.line(self.screen, COLORS['text'],
-                        (section_width, panel_y + section_padding),
-                        (section_width, panel_y + panel_height - section_padding))
-        
-        # Helper function to draw player stats
-        def draw_player_stats(player, section_x, is_player1):
-            # Get current time for calculations
-            current_time = time.time()
-            
-            # Calculate number of lines we'll need based on active effects
-            lines = []
-            y_offset = 0
-            
-            # Player name and speed
-            total_speed = player.get_total_speed_multiplier(current_time)
-            speed_text = f"P{1 if is_player1 else 2} Speed: {int(total_speed * 100)}%"
-            lines.append((speed_text, COLORS['text']))
-            
-            # Shield status
-            shield_color = COLORS['player1'] if is_player1 else COLORS['player2']
-            shield_status_color = shield_color if player.shield_active else COLORS['text']
-            shield_text = f"Shield: {'ACTIVE' if player.shield_active else 'inactive'}"
-            lines.append((shield_text, shield_status_color))
-            
-            # Check for active effects and their durations
-            if player.is_speedup(current_time):
-                time_remaining = max(0, player.speedup_end_time - current_time)
-                effect_text = f"SPEED BOOST: {time_remaining:.1f}s"
-                lines.append((effect_text, COLORS['speed_boost_object']))
-            
-            if player.is_slowed(current_time):
-                time_remaining = max(0, player.slow_end_time - current_time)
-                effect_text = f"SLOWED: {time_remaining:.1f}s"
-                lines.append((effect_text, COLORS['speed_debuff_object']))
-            
-            # Shield boosts
-            active_boosts = len(player.shield_boosts)
-            if active_boosts > 0:
-                longest_boost = max(end_time for end_time, _ in player.shield_boosts)
-                time_remaining = max(0, longest_boost - current_time)
-                boosts_text = f"Block Boosts: {active_boosts} ({time_remaining:.1f}s)"
-                lines.append((boosts_text, COLORS['text']))
-            
-            # Calculate spacing based on number of lines
-            line_spacing = text_height + 3
-            total_text_height = len(lines) * line_spacing + bar_height + 5
-            start_y = panel_y + (panel_height - total_text_height) // 2
-            
-            # Draw all text lines
-            text_x = section_x + section_padding
-            y_pos = start_y
-            for text, color in lines:
-                text_surface = self.font.render(text, True, color)
-                self.screen.blit(text_surface, (text_x, y_pos))
-                y_pos += line_spacing
+    def _render_stats_background(self):
+        """
+        Render the parts of the stats panel that never change
+        
+        Returns:
+            Surface the size of the stats panel with its background and
+            vertical separator line already drawn
+        """
+        background = pygame.Surface((STATS_PANEL_WIDTH, STATS_PANEL_HEIGHT)).convert(self.screen)
+        background.fill(COLORS['stats_panel'])
+        pygame.draw.line(background, COLORS['text'],
+                        (STATS_SECTION_WIDTH, STATS_SECTION_PADDING),
+                        (STATS_SECTION_WIDTH, STATS_PANEL_HEIGHT - STATS_SECTION_PADDING))
+        return background
+    
+    def _get_font(self, size):
+        """
+        Get the default font at a given size, loading it only the first time
+        
+        Args:
+            size: Font size in points
             
-            # Draw progress bar at the bottom
-            progress = min(100, player.get_progress())  # Cap at 100%
-            bar_y = y_pos + 3
+        Returns:
+            pygame font object
+        """
+        font = self._font_cache.get(size)
+        if font is None:
+            font = pygame.font.Font(None, size)
+            self._font_cache[size] = font
+        return font
+    
+    def _render_cached(self, font, text, color):
+        """
+        Render text with antialiasing, reusing the surface if it was rendered before
+        
+        Args:
+            font: pygame font object
+            text: string to render
+            color: text color
             
-            # Draw progress bar background
-            bar_x = text_x
-            pygame.draw.rect(self.screen, COLORS['progress_bar_bg'], 
-                            (bar_x, bar_y, bar_width, bar_height))
+        Returns:
+            The rendered text surface
+        """
+        # The font object itself is part of the key (not just its id) so a
+        # font that gets garbage collected can never alias a newer one
+        key = (font, text, color)
+        text_cache = self._text_cache
+        surface = text_cache.get(key)
+        if surface is None:
+            # Keep the cache bounded - values like timers produce many strings,
+            # so drop the least recently used surface to make room
+            if len(text_cache) >= TEXT_CACHE_MAX_SIZE:
+                text_cache.popitem(last=False)
+            surface = font.render(text, True, color)
+            text_cache[key] = surface
+        else:
+            text_cache.move_to_end(key)
+        return surface
+    
+    def _render_stat(self, key, template, values, color):
+        """
+        Render one stats panel line, reusing the last surface while its values are unchanged
+        
+        The text is only formatted when the values (or color) differ from the
+        previous frame, so stable stats cost a tuple compare instead of building
+        a new string every frame.
+        
+        Args:
+            key: Identifies the stat line, e.g. (player_num, 'speed')
+            template: str.format template for the line
+            values: Tuple of values to format into the template
+            color: Text color
             
-            # Draw progress bar fill
-            fill_width = int(bar_width * (progress / 100))
-            pygame.draw.rect(self.screen, COLORS['progress_bar_fill'], 
-                            (bar_x, bar_y, fill_width, bar_height))
+        Returns:
+            The rendered text surface
+        """
+        last = self._last_stats.get(key)
+        if last is not None and last[0] == values and last[1] == color:
+            return last[2]
+        surface = self._render_cached(self.font, template.format(*values), color)
+        self._last_stats[key] = (values, color, surface)
+        return surface
+    
+    def draw_stats_panel(self, player1, player2, current_time, refresh=True):
+        """
+        Draw the stats panel below the game board
+        
+        Args:
+            player1: Player 1
+            player2: Player 2
+            current_time: Current game time (the same time the frame was simulated at)
+            refresh: If False, show the last drawn stats without checking them for
+                     changes (used to save time when the game is falling behind)
+        """
+        # Each player's half of the panel is kept as its own surface, so frames where
+        # nothing shown changed cost two blits (plus one per line running onto the board)
+        section1, overflow1 = self._stats_section(player1, 1, current_time, refresh)  # Player 1 (left section)
+        section2, overflow2 = self._stats_section(player2, 2, current_time, refresh)  # Player 2 (right section)
+        self.screen.blits([(section1, (0, STATS_PANEL_Y)), (section2, (STATS_SECTION_WIDTH, STATS_PANEL_Y))]
+                          + overflow1 + overflow2, doreturn=0)
+    
+    def _stats_section(self, player, player_num, current_time, refresh=True):
+        """
+        Get the surface of one player's half of the stats panel
+        
+        The section is only redrawn when one of the values it shows changed
+        since the previous frame; otherwise the last surface is returned as is.
+        
+        Args:
+            player: The player whose stats are shown
+            player_num: 1 for the left section, 2 for the right section
+            current_time: Current game time
+            refresh: If False, return the last drawn section as is (when there is one)
             
-            # Draw progress percentage text
-            progress_text = f"{int(progress)}%"
-            progress_surface = self.font.render(progress_text, True, COLORS['text'])
-            text_width = progress_surface.get_width()
-            # Position text to the right of the bar with padding
-            progress_x = bar_x + bar_width + section_padding
-            progress_y = bar_y + (bar_height - progress_surface.get_height()) // 2  # Center vertically
-            self.screen.blit(progress_surface, (progress_x, progress_y))
-        
-        # Draw stats for both players
-        draw_player_stats(player1, 0, True)  # Player 1 (left section)
-        draw_player_stats(player2, section_width, False)  # Player 2 (right section)
+        Returns:
+            tuple: (surface covering the player's section of the stats panel,
+                    list of (surface, screen position, area) blits for the parts
+                    of lines above the panel)
+        """
+        cached = self._stats_sections.get(player_num)
+        if not refresh and cached is not None:
+            return cached[1], cached[2]
+        
+        # Everything the section shows (timers are shown to 0.1s)
+        # The speed comes first since working it out drops expired shield boosts
+        speed_percent = int(player.get_total_speed_multiplier(current_time) * 100)
+        shield_active = player.shield_active
+        speedup_remaining = None
+        if player.is_speedup(current_time):
+            speedup_remaining = round(max(0, player.speedup_end_time - current_time), 1)
+        slow_remaining = None
+        if player.is_slowed(current_time):
+            slow_remaining = round(max(0, player.slow_end_time - current_time), 1)
+        active_boosts = len(player.shield_boosts)
+        boosts_remaining = None
+        if active_boosts > 0:
+            # The last boost added is the longest-lasting one
+            boosts_remaining = round(max(0, player.shield_boosts[-1][0] - current_time), 1)
+        progress = min(100, player.get_progress())  # Cap at 100%
+        state = (speed_percent, shield_active, player.color, speedup_remaining, slow_remaining, active_boosts, boosts_remaining,
+                 int(progress), int(STATS_BAR_WIDTH * (progress / 100)))
+        
+        if cached is not None and cached[0] == state:
+            return cached[1], cached[2]
+        
+        if cached is None:
+            section_width = STATS_SECTION_WIDTH if player_num == 1 else STATS_PANEL_WIDTH - STATS_SECTION_WIDTH
+            section = pygame.Surface((section_width, STATS_PANEL_HEIGHT)).convert(self.screen)
+        else:
+            section = cached[1]
+        overflow = self._render_stats_section(section, player_num, *state)
+        self._stats_sections[player_num] = (state, section, overflow)
+        return section, overflow
+    
+    def _render_stats_section(self, section, player_num, speed_percent, shield_active, player_color,
+                              speedup_remaining, slow_remaining, active_boosts, boosts_remaining,
+                              progress_percent, fill_width):
+        """
+        Render one player's stats onto their section surface (see _stats_section)
+        
+        Returns:
+            list of (surface, screen position, area) blits for the top parts of
+            lines that start above the panel, which the section surface can't hold
+        """
+        text_color = COLORS['text']
+        
+        # Start from this section's part of the pre-rendered background (and separator line)
+        section_x = 0 if player_num == 1 else STATS_SECTION_WIDTH
+        section.blit(self._stats_background, (0, 0),
+                     (section_x, 0, section.get_width(), STATS_PANEL_HEIGHT))
+        
+        # Calculate number of lines we'll need based on active effects
+        lines = []
+        
+        # Player name and speed
+        lines.append(self._render_stat((player_num, 'speed'), "P{} Speed: {}%",
+                                       (player_num, speed_percent), text_color))
+        
+        # Shield status
+        shield_status_color = player_color if shield_active else text_color  # Player 1 is red, player 2 is blue
+        lines.append(self._render_stat((player_num, 'shield'), "Shield: {}",
+                                       ('ACTIVE' if shield_active else 'inactive',),
+                                       shield_status_color))
+        
+        # Active effects and their durations
+        if speedup_remaining is not None:
+            lines.append(self._render_stat((player_num, 'speedup'), "SPEED BOOST: {:.1f}s",
+                                           (speedup_remaining,), COLORS['speed_boost_object']))
+        
+        if slow_remaining is not None:
+            lines.append(self._render_stat((player_num, 'slow'), "SLOWED: {:.1f}s",
+                                           (slow_remaining,), COLORS['speed_debuff_object']))
+        
+        # Shield boosts
+        if boosts_remaining is not None:
+            lines.append(self._render_stat((player_num, 'boosts'), "Block Boosts: {} ({:.1f}s)",
+                                           (active_boosts, boosts_remaining), text_color))
+        
+        # Queue all text lines, starting where the block is centered for this many lines
+        text_x = STATS_SECTION_PADDING
+        y_pos = STATS_START_Y[len(lines)]
+        blits = []
+        overflow = []
+        for text_surface in lines:
+            blits.append((text_surface, (text_x, y_pos)))
+            if y_pos < 0:
+                # The section clips this line, so the part above the panel is
+                # drawn straight onto the screen over the board
+                overflow.append((text_surface, (section_x + text_x, STATS_PANEL_Y + y_pos),
+                                 (0, 0, text_surface.get_width(), -y_pos)))
+            y_pos += STATS_LINE_SPACING
+        
+        # Draw progress bar at the bottom
+        bar_y = y_pos + 3
+        section.fill(COLORS['progress_bar_bg'], (text_x, bar_y, STATS_BAR_WIDTH, STATS_BAR_HEIGHT))
+        section.fill(COLORS['progress_bar_fill'], (text_x, bar_y, fill_width, STATS_BAR_HEIGHT))
+        
+        # Queue progress percentage text
+        progress_surface = self._render_stat((player_num, 'progress'), "{}%",
+                                             (progress_percent,), text_color)
+        # Position text to the right of the bar with padding
+        progress_y = bar_y + (STATS_BAR_HEIGHT - progress_surface.get_height()) // 2  # Center vertically
+        blits.append((progress_surface, (STATS_PROGRESS_OFFSET_X, progress_y)))
+        
+        # Blit all of the section's text in one call
+        section.blits(blits, doreturn=0)
+        return overflow
+    
+    def _draw_memoized(self, name, state, render):
+        """
+        Blit a full-screen overlay, re-rendering it only when its state changes
+        
+        Args:
+            name: Name of the screen (each screen keeps its own cached surface)
+            state: Tuple of everything shown on the screen; passed to render as arguments
+            render: function(surface, *state) that draws the screen onto surface
+        """
+        size = self.screen.get_size()
+        cached = self._screen_cache.get(name)
+        if cached is None or cached[0] != state or cached[1].get_size() != size:
+            surface = pygame.Surface(size).convert(self.screen)
+            render(surface, *state)
+            cached = (state, surface)
+            self._screen_cache[name] = cached
+        self.screen.blit(cached[1], (0, 0))
+    
+    def _final_stats(self, player, current_time):
+        """
+        Get the values shown for a player on the victory screens
+        
+        Returns:
+            tuple: (speed percent, number of blocks, progress percent capped at 100)
+        """
+        return (int(player.get_total_speed_multiplier(current_time) * 100),
+                len(player.shield_boosts),
+                min(100, int(player.get_progress())))
     
-    def draw_victory_screen(self, winner, player1, player2):
-        """Draw the victory screen showing the winner and final stats"""
-        # Create a solid white overlay
-        overlay = pygame.Surface((GAME_CONFIG['window_width_in_pixels'], 
-                                GAME_CONFIG['window_height_in_pixels']))
-        overlay.fill((255, 255, 255))  # White background
-        self.screen.blit(overlay, (0, 0))
+    def draw_victory_screen(self, winner, player1, player2, current_time):
+        """Draw the victory screen showing the winner and final stats at current_time"""
+        # Everything shown on the screen - it is only re-rendered when this changes
+        state = (1 if winner == player1 else 2, winner.color,
+                 self._final_stats(player1, current_time),
+                 self._final_stats(player2, current_time))
+        self._draw_memoized('victory', state, self._render_victory_screen)
+    
+    def _render_victory_screen(self, surface, winner_num, winner_color, p1_values, p2_values):
+        """Render the victory screen onto surface (see draw_victory_screen)"""
+        # Look up configuration values once
+        window_width = CFG.window_width_in_pixels
+        window_height = CFG.window_height_in_pixels
+        cx = window_width // 2  # Horizontal center shared by every centered line
+        text_color = COLORS['text']
+        
+        # Cover the screen in solid white
+        surface.fill((255, 255, 255))
         
         # Calculate responsive font sizes
-        title_size = min(74, GAME_CONFIG['window_height_in_pixels'] // 10)
-        stats_size = min(36, GAME_CONFIG['window_height_in_pixels'] // 20)
-        restart_size = min(48, GAME_CONFIG['window_height_in_pixels'] // 15)
+        title_size = min(74, window_height // 10)
+        stats_size = min(36, window_height // 20)
+        restart_size = min(48, window_height // 15)
         
         # Draw victory message
-        victory_font = pygame.font.Font(None, title_size)
-        victory_text = f"Player {1 if winner == player1 else 2} Wins!"
-        victory_surface = victory_font.render(victory_text, True, winner.color)
-        victory_rect = victory_surface.get_rect(center=(GAME_CONFIG['window_width_in_pixels'] // 2, 
-                                                      GAME_CONFIG['window_height_in_pixels'] // 4))
-        self.screen.blit(victory_surface, victory_rect)
+        victory_font = self._get_font(title_size)
+        victory_text = f"Player {winner_num} Wins!"
+        victory_surface = self._render_cached(victory_font, victory_text, winner_color)
+        victory_rect = victory_surface.get_rect(center=(cx, 
+                                                      window_height // 4))
+        surface.blit(victory_surface, victory_rect)
         
         # Draw final stats
-        stats_font = pygame.font.Font(None, stats_size)
-        stats_y = victory_rect.bottom + GAME_CONFIG['window_height_in_pixels'] // 10
-        
-        # Calculate current time once
-        current_time = time.time()
+        stats_font = self._get_font(stats_size)
+        stats_y = victory_rect.bottom + window_height // 10
         
         # Player stats with capped progress
-        def get_player_stats(player, player_num):
+        def get_player_stats(values, player_num):
+            speed, blocks, progress = values
             return [
-                f"Player {player_num} Final Speed: {int(player.get_total_speed_multiplier(current_time) * 100)}%",
-                f"Blocks: {len(player.shield_boosts)}",
-                f"Progress: {min(100, int(player.get_progress()))}%"  # Cap at 100%
+                f"Player {player_num} Final Speed: {speed}%",
+                f"Blocks: {blocks}",
+                f"Progress: {progress}%"
             ]
         
         # Get stats for both players
-        p1_stats = get_player_stats(player1, 1)
-        p2_stats = get_player_stats(player2, 2)
+        p1_stats = get_player_stats(p1_values, 1)
+        p2_stats = get_player_stats(p2_values, 2)
         
         # Calculate vertical spacing between stats
-        stat_spacing = GAME_CONFIG['window_height_in_pixels'] // 25
+        stat_spacing = window_height // 25
         
         # Draw stats with proper spacing
         for i, stat in enumerate(p1_stats + p2_stats):
-            stat_surface = stats_font.render(stat, True, COLORS['text'])
-            stat_rect = stat_surface.get_rect(center=(GAME_CONFIG['window_width_in_pixels'] // 2, 
+            stat_surface = self._render_cached(stats_font, stat, text_color)
+            stat_rect = stat_surface.get_rect(center=(cx, 
                                                     stats_y + i * stat_spacing))
-            self.screen.blit(stat_surface, stat_rect)
+            surface.blit(stat_surface, stat_rect)
         
         # Draw restart prompt at the bottom with proper spacing
-        restart_font = pygame.font.Font(None, restart_size)
+        restart_font = self._get_font(restart_size)
         restart_text = "Press R to Restart"
-        restart_surface = restart_font.render(restart_text, True, COLORS['text'])
-        restart_rect = restart_surface.get_rect(center=(GAME_CONFIG['window_width_in_pixels'] // 2, 
-                                                      GAME_CONFIG['window_height_in_pixels'] * 4 // 5))
-        self.screen.blit(restart_surface, restart_rect)
+        restart_surface = self._render_cached(restart_font, restart_text, text_color)
+        restart_rect = restart_surface.get_rect(center=(cx, 
+                                                      window_height * 4 // 5))
+        surface.blit(restart_surface, restart_rect)
+    
+    def draw_round_victory_screen(self, winner, player1, player2, game_state, current_time):
+        """Draw the round victory screen showing round stats at current_time"""
+        # Everything shown on the screen - it is only re-rendered when this changes
+        # (using current_round - 1 for the round that just finished)
+        state = (1 if winner == player1 else 2, winner.color,
+                 game_state.current_round - 1, game_state.get_match_score(),
+                 self._final_stats(player1, current_time),
+                 self._final_stats(player2, current_time))
+        self._draw_memoized('round_victory', state, self._render_round_victory_screen)
     
-    def draw_round_victory_screen(self, winner, player1, player2, game_state):
-        """Draw the round victory screen showing round stats"""
-        # Create a solid white overlay
-        overlay = pygame.Surface((GAME_CONFIG['window_width_in_pixels'], 
-                                GAME_CONFIG['window_height_in_pixels']))
-        overlay.fill((255, 255, 255))  # White background
-        self.screen.blit(overlay, (0, 0))
+    def _render_round_victory_screen(self, surface, winner_num, winner_color, round_num,
+                                     match_score, p1_values, p2_values):
+        """Render the round victory screen onto surface (see draw_round_victory_screen)"""
+        # Look up configuration values once
+        window_width = CFG.window_width_in_pixels
+        window_height = CFG.window_height_in_pixels
+        cx = window_width // 2
+        text_color = COLORS['text']
+        
+        # Cover the screen in solid white
+        surface.fill((255, 255, 255))
         
         # Calculate responsive font sizes based on window height
-        window_height = GAME_CONFIG['window_height_in_pixels']
         title_size = min(64, window_height // 12)  # Reduced from 74
         stats_size = min(32, window_height // 25)  # Reduced from 36
         prompt_size = min(42, window_height // 18)  # Reduced from 48
         
-        # Draw round victory message (using current_round - 1 for the round that just finished)
-        victory_font = pygame.font.Font(None, title_size)
-        victory_text = f"Player {1 if winner == player1 else 2} Wins Round {game_state.current_round - 1}!"
-        victory_surface = victory_font.render(victory_text, True, winner.color)
-        victory_rect = victory_surface.get_rect(center=(GAME_CONFIG['window_width_in_pixels'] // 2, 
+        # Draw round victory message
+        victory_font = self._get_font(title_size)
+        victory_text = f"Player {winner_num} Wins Round {round_num}!"
+        victory_surface = self._render_cached(victory_font, victory_text, winner_color)
+        victory_rect = victory_surface.get_rect(center=(cx, 
                                                       window_height // 6))  # Moved up from 1/4
-        self.screen.blit(victory_surface, victory_rect)
+        surface.blit(victory_surface, victory_rect)
         
         # Draw round stats with adjusted spacing
-        stats_font = pygame.font.Font(None, stats_size)
+        stats_font = self._get_font(stats_size)
         stats_y = victory_rect.bottom + window_height // 20  # Reduced spacing
         
         # Draw match score
-        score_text = f"Match Score: {game_state.get_match_score()}"
-        score_surface = stats_font.render(score_text, True, COLORS['text'])
-        score_rect = score_surface.get_rect(center=(GAME_CONFIG['window_width_in_pixels'] // 2, 
+        score_text = f"Match Score: {match_score}"
+        score_surface = self._render_cached(stats_font, score_text, text_color)
+        score_rect = score_surface.get_rect(center=(cx, 
                                                   stats_y))
-        self.screen.blit(score_surface, score_rect)
+        surface.blit(score_surface, score_rect)
         stats_y += window_height // 15  # Adjusted spacing
         
         # Player stats with dynamic spacing
-        def draw_player_stats(player, player_num, y_pos):
+        def draw_player_stats(values, player_num, y_pos):
+            speed, blocks, progress = values
             stats = [
                 f"Player {player_num}:",
-                f"Final Speed: {int(player.get_total_speed_multiplier(time.time()) * 100)}%",
-                f"Blocks: {len(player.shield_boosts)}",
-                f"Progress: {min(100, int(player.get_progress()))}%"
+                f"Final Speed: {speed}%",
+                f"Blocks: {blocks}",
+                f"Progress: {progress}%"
             ]
             
             stat_spacing = window_height // 30  # Dynamic spacing based on window height
             
             for i, stat in enumerate(stats):
-                stat_surface = stats_font.render(stat, True, COLORS['text'])
-                stat_rect = stat_surface.get_rect(center=(GAME_CONFIG['window_width_in_pixels'] // 2, 
+                stat_surface = self._render_cached(stats_font, stat, text_color)
+                stat_rect = stat_surface.get_rect(center=(cx, 
                                                         y_pos + i * stat_spacing))
-                self.screen.blit(stat_surface, stat_rect)
+                surface.blit(stat_surface, stat_rect)
             return y_pos + len(stats) * stat_spacing
         
         # Draw stats for both players with adjusted spacing
-        stats_y = draw_player_stats(player1, 1, stats_y)
+        stats_y = draw_player_stats(p1_values, 1, stats_y)
         stats_y += window_height // 40  # Reduced space between players
-        stats_y = draw_player_stats(player2, 2, stats_y)
+        stats_y = draw_player_stats(p2_values, 2, stats_y)
         
         # Draw continue prompt at the bottom with proper spacing
-        prompt_font = pygame.font.Font(None, prompt_size)
+        prompt_font = self._get_font(prompt_size)
         prompt_text = "Press SPACE to start next round"
-        prompt_surface = prompt_font.render(prompt_text, True, COLORS['text'])
-        prompt_rect = prompt_surface.get_rect(center=(GAME_CONFIG['window_width_in_pixels'] // 2, 
+        prompt_surface = self._render_cached(prompt_font, prompt_text, text_color)
+        prompt_rect = prompt_surface.get_rect(center=(cx, 
                                                     window_height * 9 // 10))  # Moved closer to bottom
-        self.screen.blit(prompt_surface, prompt_rect)
+        surface.blit(prompt_surface, prompt_rect)
     
     def draw_match_victory_screen(self, winner, player1, player2, game_state):
         """Draw the match victory screen showing match summary"""
-        # Create a solid white overlay
-        overlay = pygame.Surface((GAME_CONFIG['window_width_in_pixels'], 
-                                GAME_CONFIG['window_height_in_pixels']))
-        overlay.fill((255, 255, 255))  # White background
-        self.screen.blit(overlay, (0, 0))
+        # Everything shown on the screen - it is only re-rendered when this changes
+        state = (1 if winner == player1 else 2, winner.color,
+                 tuple(game_state.round_wins), tuple(game_state.round_history))
+        self._draw_memoized('match_victory', state, self._render_match_victory_screen)
+    
+    def _render_match_victory_screen(self, surface, winner_num, winner_color, round_wins, round_history):
+        """Render the match victory screen onto surface (see draw_match_victory_screen)"""
+        # Look up configuration values once
+        window_width = CFG.window_width_in_pixels
+        window_height = CFG.window_height_in_pixels
+        cx = window_width // 2
+        text_color = COLORS['text']
+        
+        # Cover the screen in solid white
+        surface.fill((255, 255, 255))
         
         # Calculate responsive font sizes
-        title_size = min(74, GAME_CONFIG['window_height_in_pixels'] // 10)
-        stats_size = min(36, GAME_CONFIG['window_height_in_pixels'] // 20)
-        prompt_size = min(48, GAME_CONFIG['window_height_in_pixels'] // 15)
+        title_size = min(74, window_height // 10)
+        stats_size = min(36, window_height // 20)
+        prompt_size = min(48, window_height // 15)
         
         # Draw match victory message
-        victory_font = pygame.font.Font(None, title_size)
-        victory_text = f"Player {1 if winner == player1 else 2} Wins The Match!"
-        victory_surface = victory_font.render(victory_text, True, winner.color)
-        victory_rect = victory_surface.get_rect(center=(GAME_CONFIG['window_width_in_pixels'] // 2, 
-                                                      GAME_CONFIG['window_height_in_pixels'] // 4))
-        self.screen.blit(victory_surface, victory_rect)
+        victory_font = self._get_font(title_size)
+        victory_text = f"Player {winner_num} Wins The Match!"
+        victory_surface = self._render_cached(victory_font, victory_text, winner_color)
+        victory_rect = victory_surface.get_rect(center=(cx, 
+                                                      window_height // 4))
+        surface.blit(victory_surface, victory_rect)
         
         # Draw final score
-        score_font = pygame.font.Font(None, stats_size)
-        score_text = f"({game_state.round_wins[0]} - {game_state.round_wins[1]})"
-        score_surface = score_font.render(score_text, True, COLORS['text'])
-        score_rect = score_surface.get_rect(center=(GAME_CONFIG['window_width_in_pixels'] // 2, 
+        score_font = self._get_font(stats_size)
+        score_text = f"({round_wins[0]} - {round_wins[1]})"
+        score_surface = self._render_cached(score_font, score_text, text_color)
+        score_rect = score_surface.get_rect(center=(cx, 
                                                   victory_rect.bottom + 40))
-        self.screen.blit(score_surface, score_rect)
+        surface.blit(score_surface, score_rect)
         
         # Draw round history
         history_y = score_rect.bottom + 60
-        history_font = pygame.font.Font(None, stats_size)
+        history_font = self._get_font(stats_size)
         
         history_title = "Match Summary:"
-        title_surface = history_font.render(history_title, True, COLORS['text'])
-        title_rect = title_surface.get_rect(center=(GAME_CONFIG['window_width_in_pixels'] // 2, 
+        title_surface = self._render_cached(history_font, history_title, text_color)
+        title_rect = title_surface.get_rect(center=(cx, 
                                                   history_y))
-        self.screen.blit(title_surface, title_rect)
-        
-        for i, winner_num in enumerate(game_state.round_history):
-            round_text = f"Round {i + 1}: P{winner_num} Win"
-            round_surface = history_font.render(round_text, True, COLORS['text'])
-            round_rect = round_surface.get_rect(center=(GAME_CONFIG['window_width_in_pixels'] // 2, 
+        surface.blit(title_surface, title_rect)
+        
+        # Lay out every round's line first, then blit them in one call
+        history_blits = []
+        for i, round_winner_num in enumerate(round_history):
+            round_text = f"Round {i + 1}: P{round_winner_num} Win"
+            round_surface = self._render_cached(history_font, round_text, text_color)
+            round_rect = round_surface.get_rect(center=(cx, 
                                                       history_y + 40 + i * 35))
-            self.screen.blit(round_surface, round_rect)
+            history_blits.append((round_surface, round_rect))
+        surface.blits(history_blits, doreturn=0)
         
         # Draw restart prompt
-        prompt_font = pygame.font.Font(None, prompt_size)
+        prompt_font = self._get_font(prompt_size)
         prompt_text = "Press R to start new match"
-        prompt_surface = prompt_font.render(prompt_text, True, COLORS['text'])
-        prompt_rect = prompt_surface.get_rect(center=(GAME_CONFIG['window_width_in_pixels'] // 2, 
-                                                    GAME_CONFIG['window_height_in_pixels'] * 4 // 5))
-        self.screen.blit(prompt_surface, prompt_rect)
+        prompt_surface = self._render_cached(prompt_font, prompt_text, text_color)
+        prompt_rect = prompt_surface.get_rect(center=(cx, 
+                                                    window_height * 4 // 5))
+        surface.blit(prompt_surface, prompt_rect)
     
     def draw_countdown(self, game_state):
         """Draw the countdown before round starts"""
         if not game_state.countdown_active:
             return
         
-        window_width = GAME_CONFIG['window_width_in_pixels']
-        window_height = GAME_CONFIG['window_height_in_pixels']
-        
-        # Calculate dimensions for the black background rectangle
-        rect_width = window_width // 3
-        rect_height = window_height // 4
-        rect_x = (window_width - rect_width) // 2
-        rect_y = (window_height - rect_height) // 2
+        # The labels above the countdown only change between rounds, so they are
+        # laid out once per (round, match point) and reused for every countdown frame
+        match_point_wins = CFG.rounds_to_win - 1
+        is_match_point = match_point_wins in game_state.round_wins
+        labels_key = (game_state.current_round, is_match_point)
+        if self._countdown_labels_key != labels_key:
+            self._countdown_labels = self._layout_countdown_labels(*labels_key)
+            self._countdown_labels_key = labels_key
+        match_point_bg_rect, label_blits = self._countdown_labels
+        
+        # Draw the red rounded rectangle behind the match point text, then the labels
+        if match_point_bg_rect is not None:
+            pygame.draw.rect(self.screen, (255, 0, 0), match_point_bg_rect, border_radius=10)
+        self.screen.blits(label_blits, doreturn=0)
         
-        # Draw round number at the top
-        round_font = pygame.font.Font(None, window_height // 8)  # Larger font for round number
-        round_text = f"ROUND {game_state.current_round}"
-        round_surface = round_font.render(round_text, True, (0, 0, 0))
-        round_rect = round_surface.get_rect(center=(window_width // 2, rect_y - round_font.get_height()))
-        self.screen.blit(round_surface, round_rect)
+        # Draw black background rectangle for countdown
+        self.screen.fill((0, 0, 0), self._countdown_bg_rect)
         
-        # Check if this is a match point
-        is_match_point = False
-        if game_state.round_wins[0] == GAME_CONFIG['rounds_to_win'] - 1 or game_state.round_wins[1] == GAME_CONFIG['rounds_to_win'] - 1:
-            is_match_point = True
+        # Draw countdown number or "GO!" in white
+        self.screen.blit(*self._countdown_digits[max(0, game_state.countdown_ticks)])
+    
+    def _layout_countdown_labels(self, round_num, is_match_point):
+        """
+        Render and position the labels shown above the countdown
         
-        # Draw match point indicator if applicable
-        if is_match_point:
-            match_point_font = pygame.font.Font(None, window_height // 15)
-            match_point_surface = match_point_font.render("MATCH POINT", True, (255, 0, 0))  # Red text
-            match_point_rect = match_point_surface.get_rect(center=(window_width // 2, rect_y - round_font.get_height() * 2))
-            
-            # Draw a red rounded rectangle background
-            padding = 20
-            bg_rect = pygame.Rect(match_point_rect.left - padding,
-                                match_point_rect.top - padding // 2,
-                                match_point_rect.width + padding * 2,
-                                match_point_rect.height + padding)
-            pygame.draw.rect(self.screen, (255, 0, 0), bg_rect, border_radius=10)
+        Args:
+            round_num: Round number shown as "ROUND N"
+            is_match_point: Whether to show the "MATCH POINT" banner
             
-            # Draw the text in white
-            match_point_surface = match_point_font.render("MATCH POINT", True, (255, 255, 255))
-            self.screen.blit(match_point_surface, match_point_rect)
+        Returns:
+            tuple: (rect of the red match point background or None,
+                    list of (surface, rect) pairs to blit)
+        """
+        cx = CFG.window_width_in_pixels // 2  # Everything in the countdown is centered horizontally
+        rect_y = self._countdown_bg_rect.y
         
-        # Draw black background rectangle for countdown
-        countdown_bg = pygame.Rect(rect_x, rect_y, rect_width, rect_height)
-        pygame.draw.rect(self.screen, (0, 0, 0), countdown_bg)
+        # Round number at the top
+        round_font = self._round_font
+        round_surface = self._render_cached(round_font, f"ROUND {round_num}", (0, 0, 0))
+        round_rect = round_surface.get_rect(center=(cx, rect_y - round_font.get_height()))
+        label_blits = [(round_surface, round_rect)]
         
-        # Draw countdown number or "GO!" in white
-        countdown_font = pygame.font.Font(None, window_height // 4)  # Much larger font for countdown
-        if game_state.countdown_ticks > 0:
-            text = str(game_state.countdown_ticks)
-        else:
-            text = "GO!"
+        # Match point indicator if applicable
+        match_point_bg_rect = None
+        if is_match_point:
+            match_point_font = self._match_point_font
+            # The text is drawn in white on a red rounded rectangle
+            match_point_surface = self._render_cached(match_point_font, "MATCH POINT", (255, 255, 255))
+            match_point_rect = match_point_surface.get_rect(center=(cx, rect_y - round_font.get_height() * 2))
+            padding = 20
+            match_point_bg_rect = pygame.Rect(match_point_rect.left - padding,
+                                              match_point_rect.top - padding // 2,
+                                              match_point_rect.width + padding * 2,
+                                              match_point_rect.height + padding)
+            label_blits.append((match_point_surface, match_point_rect))
         
-        text_surface = countdown_font.render(text, True, (255, 255, 255))  # White text
-        text_rect = text_surface.get_rect(center=(window_width // 2, window_height // 2))
-        self.screen.blit(text_surface, text_rect)
+        return match_point_bg_rect, label_blits
 
     def draw_instructions_screen(self):
         """
@@ -403,97 +735,107 @@ class Renderer:
         - Game structure (rounds, win conditions)
         
         The screen dynamically adjusts font sizes to ensure all content fits on screen.
+        The content only depends on the window size and GAME_CONFIG, so it is
+        rendered once to a surface and that surface is blitted on later frames.
+        """
+        # Re-render only when the size of the screen being drawn on changes
+        cache_key = self.screen.get_size()
+        if self._instructions_cache_key != cache_key:
+            self._instructions_cache = self._render_instructions_screen(*cache_key)
+            self._instructions_cache_key = cache_key
+        
+        self.screen.blit(self._instructions_cache, (0, 0))
+    
+    def _render_instructions_screen(self, window_width, window_height):
+        """
+        Render the full instructions screen to a new surface
+        
+        Args:
+            window_width: Width of the window in pixels
+            window_height: Height of the window in pixels
+            
+        Returns:
+            Surface containing the instructions screen
         """
-        screen = self.screen
-        window_width = GAME_CONFIG['window_width_in_pixels']
-        window_height = GAME_CONFIG['window_height_in_pixels']
-        
-        # Create semi-transparent overlay
-        overlay = pygame.Surface((window_width, window_height))
-        overlay.set_alpha(240)
-        overlay.fill((255, 255, 255))
-        screen.blit(overlay, (0, 0))
-        
-        # Define all instruction content
-        instructions = [
-            ("How to Play", "title"),
-            ("1. Race to the finish line first!", "heading"),
-            ("Reach 100% at center to win the round.", "body"),
-            ("2. Use walls for cover", "heading"),
-            ("Hide behind gray walls. They block bullets.", "body"),
-            ("3. Combat controls", "heading"),
-            ("Player 1 (Red):", "p1"),
-            ("WASD = Move, V = Shoot, B = Shield", "body"),
-            ("Player 2 (Blue):", "p2"),
-            ("Arrows = Move, , = Shoot, . = Shield", "body"),
-            ("4. Getting hit slows you", "heading"),
-            (f"Speed drops to {GAME_CONFIG['slow_factor']}x ({int((1-GAME_CONFIG['slow_factor'])*100)}% slower) for {GAME_CONFIG['slow_duration']:.0f}s. Attacker speeds up!", "body"),
-            ("5. Blocking gives speed boost", "heading"),
-            (f"Each block: +{int(GAME_CONFIG['shield_boost_amount']*100)}% for {GAME_CONFIG['shield_boost_duration']:.0f}s (max {int(GAME_CONFIG['shield_boost_max']*100)}%).", "body"),
-            (f"6. Win {GAME_CONFIG['rounds_to_win']} rounds to win match", "heading"),
-            (f"Best of {GAME_CONFIG['rounds_to_win'] * 2 - 1} rounds.", "body"),
-            ("", "spacer"),
-            ("Press SPACE to start", "prompt"),
-        ]
+        screen = pygame.Surface((window_width, window_height)).convert(self.screen)
+        # Backdrop is a white overlay at alpha 240 over the background color;
+        # blend it here and fill with the result instead of alpha-blitting an overlay
+        screen.fill(tuple(round(channel + (255 - channel) * INSTRUCTIONS_OVERLAY_ALPHA / 255)
+                          for channel in COLORS['background']))
         
         # Calculate optimal font size that fits all content
         max_font_size = int(window_height / 15)
         min_font_size = int(window_height / 45)
         
         # Function to calculate total height for a given font size
+        # Results are remembered on the renderer so a size is only measured once
         def calc_height(base_size):
-            title_font = pygame.font.Font(None, int(base_size * 1.8))
-            heading_font = pygame.font.Font(None, int(base_size * 1.3))
-            body_font = pygame.font.Font(None, base_size)
-            prompt_font = pygame.font.Font(None, int(base_size * 1.2))
+            cache_key = (base_size, window_width)
+            if cache_key in self._calc_height_cache:
+                return self._calc_height_cache[cache_key]
+            
+            title_font = self._get_font(int(base_size * 1.8))
+            heading_font = self._get_font(int(base_size * 1.3))
+            body_font = self._get_font(base_size)
+            prompt_font = self._get_font(int(base_size * 1.2))
             
             height = base_size // 3  # Top margin
             text_width = window_width - (window_width // 10) * 2
             
-            for text, style in instructions:
+            for text, style in INSTRUCTIONS:
                 if not text:
                     height += base_size // 3
                     continue
                     
                 if style == "title":
-                    lines = render_multiline_text(title_font, text, COLORS['text'], text_width)
+                    lines = wrap_text(title_font, text, text_width)
                     height += len(lines) * title_font.get_height() * 1.3
                 elif style == "heading":
                     height += heading_font.get_height() * 0.5  # Extra space before heading
-                    lines = render_multiline_text(heading_font, text, COLORS['text'], text_width)
+                    lines = wrap_text(heading_font, text, text_width)
                     height += len(lines) * heading_font.get_height() * 1.2
                 elif style == "prompt":
-                    lines = render_multiline_text(prompt_font, text, COLORS['text'], text_width)
+                    lines = wrap_text(prompt_font, text, text_width)
                     height += len(lines) * prompt_font.get_height() * 1.3
                 else:
-                    lines = render_multiline_text(body_font, text, COLORS['text'], text_width)
+                    lines = wrap_text(body_font, text, text_width)
                     height += len(lines) * body_font.get_height() * 1.15
             
             height += base_size // 3  # Bottom margin
+            self._calc_height_cache[cache_key] = height
             return height
         
-        # Binary search for optimal font size
-        optimal_size = min_font_size
-        for size in range(max_font_size, min_font_size - 1, -2):
-            if calc_height(size) <= window_height * 0.95:
-                optimal_size = size
-                break
+        # Binary search for the largest font size that fits
+        # (falls back to the minimum size if nothing fits)
+        low, high = min_font_size, max_font_size
+        while low < high:
+            mid = (low + high + 1) // 2
+            if calc_height(mid) <= window_height * 0.95:
+                low = mid
+            else:
+                high = mid - 1
+        optimal_size = low
         
         # Define fonts with optimal size
-        title_font = pygame.font.Font(None, int(optimal_size * 1.8))
-        heading_font = pygame.font.Font(None, int(optimal_size * 1.3))
-        body_font = pygame.font.Font(None, optimal_size)
-        prompt_font = pygame.font.Font(None, int(optimal_size * 1.2))
+        title_font = self._get_font(int(optimal_size * 1.8))
+        heading_font = self._get_font(int(optimal_size * 1.3))
+        body_font = self._get_font(optimal_size)
+        prompt_font = self._get_font(int(optimal_size * 1.2))
         
         # Calculate starting Y to center content
         total_height = calc_height(optimal_size)
         y_pos = max((window_height - total_height) / 2, optimal_size // 3)
         
         # Render all instructions with optimal font size
+        text_color = COLORS['text']
+        p1_color = COLORS['player1']
+        p2_color = COLORS['player2']
         text_width = window_width - (window_width // 10) * 2
         x_pos = window_width // 10
         
-        for text, style in instructions:
+        # Collect every line first, then blit them all in one call
+        blits = []
+        for text, style in INSTRUCTIONS:
             # Skip empty spacer elements
             if not text and style == "spacer":
                 y_pos += body_font.get_height() // 2
@@ -502,50 +844,54 @@ class Renderer:
             # Determine font and color based on style
             if style == "title":
                 font = title_font
-                color = COLORS['text']
-                lines = render_multiline_text(font, text, color, text_width)
+                color = text_color
+                lines = render_multiline_text(font, text, color, text_width, self._render_cached)
                 for line in lines:
                     line_x = (window_width - line.get_width()) // 2
-                    screen.blit(line, (line_x, y_pos))
+                    blits.append((line, (line_x, y_pos)))
                     y_pos += int(font.get_height() * 1.3)
                 y_pos += font.get_height() // 2
                 
             elif style == "heading":
                 font = heading_font
-                color = COLORS['text']
+                color = text_color
                 y_pos += font.get_height() // 2
-                lines = render_multiline_text(font, text, color, text_width)
+                lines = render_multiline_text(font, text, color, text_width, self._render_cached)
                 for line in lines:
-                    screen.blit(line, (x_pos, y_pos))
+                    blits.append((line, (x_pos, y_pos)))
                     y_pos += int(font.get_height() * 1.2)
                     
             elif style == "p1":
                 font = body_font
-                color = COLORS['player1']
-                surface = font.render(text, True, color)
-                screen.blit(surface, (x_pos, y_pos))
+                color = p1_color
+                surface = self._render_cached(font, text, color)
+                blits.append((surface, (x_pos, y_pos)))
                 y_pos += int(font.get_height() * 1.15)
                 
             elif style == "p2":
                 font = body_font
-                color = COLORS['player2']
-                surface = font.render(text, True, color)
-                screen.blit(surface, (x_pos, y_pos))
+                color = p2_color
+                surface = self._render_cached(font, text, color)
+                blits.append((surface, (x_pos, y_pos)))
                 y_pos += int(font.get_height() * 1.15)
                 
             elif style == "prompt":
                 font = prompt_font
-                color = COLORS['text']
-                lines = render_multiline_text(font, text, color, text_width)
+                color = text_color
+                lines = render_multiline_text(font, text, color, text_width, self._render_cached)
                 for line in lines:
                     line_x = (window_width - line.get_width()) // 2
-                    screen.blit(line, (line_x, y_pos))
+                    blits.append((line, (line_x, y_pos)))
                     y_pos += int(font.get_height() * 1.3)
                     
             else:  # body text
                 font = body_font
-                color = COLORS['text']
-                lines = render_multiline_text(font, text, color, text_width)
+                color = text_color
+                lines = render_multiline_text(font, text, color, text_width, self._render_cached)
                 for line in lines:
-                    screen.blit(line, (x_pos, y_pos))
+                    blits.append((line, (x_pos, y_pos)))
                     y_pos += int(font.get_height() * 1.15)
+        
+        screen.blits(blits, doreturn=0)
+        
+        return screen
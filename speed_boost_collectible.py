@@ -1,11 +1,17 @@
 """Speed Boost Collectible - Increases player speed"""
-from game_collectible import GameCollectible, register_collectible_type
+from game_collectible import GameCollectible, compound_end_time, register_collectible_type
 from game_config import GAME_CONFIG, COLORS
 
+# How long a speed boost lasts (seconds)
+_SPEED_BOOST_DURATION = GAME_CONFIG['speed_boost_duration']
+
 
 class SpeedBoostCollectible(GameCollectible):
     """A collectible that increases the player's speed"""
     
+    __slots__ = ()  # No attributes beyond GameCollectible's
+    COLOR = COLORS['speed_boost_object']  # Same for every instance, so looked up once
+    
     def __init__(self, x, y):
         """
         Initialize a speed boost collectible
@@ -14,7 +20,7 @@ class SpeedBoostCollectible(GameCollectible):
             x: X position in tiles
             y: Y position in tiles
         """
-        super().__init__(x, y, COLORS['speed_boost_object'])
+        super().__init__(x, y, self.COLOR)
     
     def apply_effect(self, player, current_time, other_player=None):
         """
@@ -25,17 +31,9 @@ class SpeedBoostCollectible(GameCollectible):
             current_time: Current game time
             other_player: The other Player (not used for this collectible)
         """
-        # Calculate time to add (compound if already has speedup effect)
-        if current_time < player.speedup_end_time:
-            # Already has speedup - extend the duration
-            remaining_time = player.speedup_end_time - current_time
-            new_total_duration = remaining_time + GAME_CONFIG['speed_boost_duration']
-        else:
-            # No existing speedup - start fresh
-            new_total_duration = GAME_CONFIG['speed_boost_duration']
-        
-        # Apply the compounded speedup effect
-        player.speedup_end_time = current_time + new_total_duration
+        # Extend any speedup that is still running (compounding), or start a fresh one
+        player.speedup_end_time = compound_end_time(player.speedup_end_time, current_time,
+                                                    _SPEED_BOOST_DURATION)
 
 
 # Register this collectible type
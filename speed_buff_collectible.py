@@ -1,16 +1,22 @@
-"""Speed Buff Collectible - Speeds up the player who collects it"""
-from game_collectible import GameCollectible, register_collectible_type
+"""Speed Buff Collectible - Slows down the opponent of the player who collects it"""
+from game_collectible import GameCollectible, compound_end_time, register_collectible_type
 from game_config import COLORS, GAME_CONFIG
 
+# How long the opponent stays slowed (seconds)
+_SPEED_DEBUFF_DURATION = GAME_CONFIG['speed_debuff_duration']
+
 
 class SpeedBuffCollectible(GameCollectible):
     """
-    A collectible that increases the player's speed
+    A collectible that decreases the other player's speed
     
-    This collectible speeds up the player who collects it.
-    Multiple collections compound the effect (add more time to the buff).
+    This collectible slows down the opponent of the player who collects it.
+    Multiple collections compound the effect (add more time to the slow).
     """
     
+    __slots__ = ()  # No attributes beyond GameCollectible's
+    COLOR = COLORS['speed_debuff_object']  # Using existing color, looked up once for the class
+    
     def __init__(self, x, y):
         """
         Initialize a speed buff collectible
@@ -20,7 +26,7 @@ class SpeedBuffCollectible(GameCollectible):
             y: Y position in tiles
         """
         # Call the parent class's __init__ method
-        super().__init__(x, y, COLORS['speed_debuff_object'])  # Using existing color
+        super().__init__(x, y, self.COLOR)
     
     def apply_effect(self, player, current_time, other_player=None):
         """
@@ -32,17 +38,10 @@ class SpeedBuffCollectible(GameCollectible):
             other_player: The other Player that is being slowed down
         """
         if other_player is not None:
-            # Calculate time to add (compound if already has slow effect)
-            if current_time < other_player.slow_end_time:
-                # Already slowed - extend the duration
-                remaining_time = other_player.slow_end_time - current_time
-                new_total_duration = remaining_time + GAME_CONFIG['speed_debuff_duration']
-            else:
-                # No existing slow - start fresh
-                new_total_duration = GAME_CONFIG['speed_debuff_duration']
-
-            # Apply the compounded slow effect (NOT speedup!)
-            other_player.slow_end_time = current_time + new_total_duration
+            # Extend any slow that is still running (compounding), or start a fresh one
+            # (slow effect, NOT speedup!)
+            other_player.slow_end_time = compound_end_time(other_player.slow_end_time, current_time,
+                                                           _SPEED_DEBUFF_DURATION)
 
 
 # Register this collectible type
@@ -1,5 +1,5 @@
 import pygame
-from game_config import GAME_CONFIG
+from game_config import CFG
 
 
 class Wall:
@@ -15,15 +15,22 @@ class Wall:
         """
         self.x = float(x)
         self.y = float(y)
-        self.width = GAME_CONFIG['wall_width']
-        self.height = GAME_CONFIG['wall_height']
+        self.width = CFG.wall_width
+        self.height = CFG.wall_height
+        self.color = CFG.wall_color  # Color draw_walls fills the wall with
+        
+        # Walls never move, so the area they occupy is worked out once here
+        min_x = self.x
+        min_y = self.y - self.height  # Bottom-aligned
+        self._bounds = (min_x, min_y, self.x + self.width, self.y)
         
         # Create rect for drawing and collision detection
+        tile_size = CFG.tile_size_in_pixels
         self.rect = pygame.Rect(
-            int(self.x * GAME_CONFIG['tile_size_in_pixels']),
-            int((self.y - self.height) * GAME_CONFIG['tile_size_in_pixels']),  # Bottom-aligned
-            int(self.width * GAME_CONFIG['tile_size_in_pixels']),
-            int(self.height * GAME_CONFIG['tile_size_in_pixels'])
+            int(min_x * tile_size),
+            int(min_y * tile_size),
+            int(self.width * tile_size),
+            int(self.height * tile_size)
         )
     
     def get_tile_bounds(self):
@@ -33,7 +40,7 @@ class Wall:
         Returns:
             tuple: (min_x, min_y, max_x, max_y) in tiles
         """
-        return (self.x, self.y - self.height, self.x + self.width, self.y)
+        return self._bounds
     
     def overlaps_with(self, other_wall):
         """
@@ -51,12 +58,33 @@ class Wall:
         # Check if rectangles overlap
         return not (self_max_x <= other_min_x or self_min_x >= other_max_x or
                    self_max_y <= other_min_y or self_min_y >= other_max_y)
+
+
+def walls_any_overlap(new_wall, walls):
+    """
+    Check if a wall overlaps any wall in a list
     
-    def draw(self, screen):
-        """
-        Draw the wall on the screen
+    Args:
+        new_wall: Wall object to check
+        walls: List of Wall objects to check against
         
-        Args:
-            screen: The pygame surface to draw on
-        """
-        pygame.draw.rect(screen, GAME_CONFIG['wall_color'], self.rect)
+    Returns:
+        True if new_wall overlaps at least one of the walls, False otherwise
+    """
+    # any() stops at the first overlap
+    return any(new_wall.overlaps_with(wall) for wall in walls)
+
+
+def draw_walls(screen, walls):
+    """
+    Draw all walls on the screen
+    
+    Args:
+        screen: The pygame surface to draw on
+        walls: List of Wall objects to draw
+    """
+    # Walls are solid rectangles, so a plain fill is all that's needed
+    # (cheaper than going through pygame.draw.rect for each one)
+    fill = screen.fill
+    for wall in walls:
+        fill(wall.color, wall.rect)